@@ -1,3 +1,7 @@
+import sys
+
+import proyeccion_ahorros
+
 # --- Pedir nombre al usuario ---
 nombre = input("Ingresa tu nombre: ")
 
@@ -29,4 +33,21 @@ gasto_anual = gastos_semanales * 52
 # --- Calculamos los ahorros
 ahorro_anual = ganancia_anual - gasto_anual
 
-print("Tu ahorro anual será de", ahorro_anual, "euros")
\ No newline at end of file
+print("Tu ahorro anual será de", ahorro_anual, "euros")
+
+# --- Proyeccion a varios años: python "Código calculadora_ahorros.py" años [caminos] ---
+if len(sys.argv) > 1:
+    años = int(sys.argv[1])
+    caminos = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+
+    # simulamos por bloques de 100000 caminos para no llenar la memoria
+    saldos = proyeccion_ahorros.proyectar(ingresos_hora, horas_trabajadas, gastos_semanales, años, caminos,
+                                          tamano_bloque = 100000)
+    bandas = proyeccion_ahorros.bandas(saldos)
+    deficit = proyeccion_ahorros.probabilidad_deficit(saldos)
+
+    print("Proyeccion de ahorro acumulado con", caminos, "simulaciones (percentiles",
+          proyeccion_ahorros.PERCENTILES, ")")
+    for año in range(años):
+        print("Año", año + 1, ":", [round(valor, 2) for valor in bandas[:, año].tolist()],
+              "- probabilidad de ahorro negativo:", round(float(deficit[año]) * 100, 1), "%")
@@ -1,11 +1,19 @@
+import sys
+
+import cambio_divisas
+
+# --- Tipos de cambio: fichero pasado como argumento o los de por defecto ---
+cache = cambio_divisas.crear_cache(sys.argv[1] if len(sys.argv) > 1 else None)
+tipo = cambio_divisas.obtener_tasas(cache)[("EUR", "USD")]
+
 # --- Pedir al usuario que ingrese la cantidad en euros ---
 euros = input("Ingresa la cantidad de euros que deseas convertir: ") # tipo string
 
-# --- Convertimos la cantidad ingresada a un float ---
-euros = float(euros)
+# --- Convertimos la cantidad ingresada a centimos (entero, sin errores de redondeo) ---
+euros = cambio_divisas.a_centimos(euros)[0]
 
 # --- Convertir la cantidad de euros a dolares ---
-dolares = euros * 1.2
+dolares = cambio_divisas.convertir(euros, tipo)
 
 # --- Imprimir el resultado de la conversión ---
-print(euros, "euros son", dolares, "dólares")
+print(cambio_divisas.formatear(euros), "euros son", cambio_divisas.formatear(dolares), "dólares")
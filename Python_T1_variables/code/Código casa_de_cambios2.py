@@ -1,20 +1,25 @@
+import sys
+
+import cambio_divisas
+
+# --- Tipos de cambio: fichero pasado como argumento o los de por defecto ---
+cache = cambio_divisas.crear_cache(sys.argv[1] if len(sys.argv) > 1 else None)
+tipo = cambio_divisas.obtener_tasas(cache)[("EUR", "USD")]
+
 # --- Pedir al usuario que ingrese la cantidad en euros ---
 euros = input("Ingresa la cantidad de euros que deseas convertir: ") # tipo string
 
-# --- Convertimos la cantidad ingresada a un float ---
-euros = float(euros)
+# --- Convertimos la cantidad ingresada a centimos (entero, sin errores de redondeo) ---
+euros = cambio_divisas.a_centimos(euros)[0]
 
 # --- Convertir la cantidad de euros a dolares ---
-dolares = euros * 1.2
-
-# --- Calculamos la cantidad que se queda la casa de cambios ---
-tasas_gestion = dolares * 0.1
+dolares = cambio_divisas.convertir(euros, tipo)
 
-# --- Calculamos la cantidad de dolares que recibe el usuario ---
-dolares_recibidos = dolares - tasas_gestion
+# --- Calculamos la cantidad que se queda la casa de cambios y la que recibe el usuario ---
+tasas_gestion, dolares_recibidos = cambio_divisas.aplicar_comision(dolares, "0.1")
 
 # --- Imprimimos el desglose de la operación ---
-print("Monto ingresado: ", euros, " euros")
-print("Cambio en dólares: ", dolares, " dólares")
-print("Tasa de gestión: ", tasas_gestion, " dólares")
-print("Monto recibido: ", dolares_recibidos, " dólares")
+print("Monto ingresado: ", cambio_divisas.formatear(euros), " euros")
+print("Cambio en dólares: ", cambio_divisas.formatear(dolares), " dólares")
+print("Tasa de gestión: ", cambio_divisas.formatear(tasas_gestion), " dólares")
+print("Monto recibido: ", cambio_divisas.formatear(dolares_recibidos), " dólares")
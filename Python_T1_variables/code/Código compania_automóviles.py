@@ -1,24 +1,30 @@
-# --- Preguntar al usuario cuantos coches ha vendido de cada tipo ---
-rbm_serie1_vendidos = int(input("¿Cuántos RBM serie 1 has vendido? "))
-rbm_plus_vendidos = int(input("¿Cuántps RBM plus has vendido? "))
-rbm_todoterreno_vendidos = int(input("¿Cuántos RBM todoterreno has vendido?"))
+import sys
 
-# --- Guardamos los datos en variables ---
-precio_rbm_serie1 = 20000
-precio_rbm_plus = 35000
-precio_rbm_todoterreno = 60000
+import comisiones
 
-comision_rbm_serie1 = 0.03
-comision_rbm_plus = 0.05
-comision_rbm_todoterreno = 0.07
+# --- Modo fichero: python "Código compania_automóviles.py" ventas.csv [modelos.csv] ---
+if len(sys.argv) > 1:
+    tabla = comisiones.cargar_tabla(sys.argv[2]) if len(sys.argv) > 2 else comisiones.crear_tabla()
+    vendedores, ventas, ganancias = comisiones.procesar_fichero(tabla, sys.argv[1], comisiones.TRAMOS)
 
-# --- Calculamos la cantidad de euros a comisionar ese mes ---
-ganancia_rbm_serie_1 = rbm_serie1_vendidos * precio_rbm_serie1 * comision_rbm_serie1
-ganancia_rbm_plus = rbm_plus_vendidos * precio_rbm_plus * comision_rbm_plus
-ganancia_rbm_todoterreno = rbm_todoterreno_vendidos * precio_rbm_todoterreno * comision_rbm_todoterreno
+    for vendedor, venta, ganancia in zip(vendedores.tolist(), ventas.tolist(), ganancias.tolist()):
+        print(vendedor, "ha vendido", venta, "euros y comisiona", round(ganancia, 2), "euros")
+else:
+    # --- Preguntar al usuario cuantos coches ha vendido de cada tipo ---
+    rbm_serie1_vendidos = int(input("¿Cuántos RBM serie 1 has vendido? "))
+    rbm_plus_vendidos = int(input("¿Cuántps RBM plus has vendido? "))
+    rbm_todoterreno_vendidos = int(input("¿Cuántos RBM todoterreno has vendido?"))
 
-ganancia_total = ganancia_rbm_serie_1 + ganancia_rbm_plus + ganancia_rbm_todoterreno 
+    # --- Los precios y comisiones de cada modelo estan en la tabla de modelos ---
+    tabla = comisiones.crear_tabla()
 
-# --- Imprimimos la ganancia total ---
+    # --- Calculamos la cantidad de euros a comisionar ese mes ---
+    modelos = ["RBM serie 1", "RBM plus", "RBM todoterreno"]
+    vendidos = [rbm_serie1_vendidos, rbm_plus_vendidos, rbm_todoterreno_vendidos]
+    vendedores, ventas, ganancias = comisiones.comisiones_vendedores(tabla, ["yo"] * 3, modelos, vendidos)
 
-print("La cantidad total de euros a comisionar este més es de ", ganancia_total, "euros")
\ No newline at end of file
+    ganancia_total = float(ganancias[0])
+
+    # --- Imprimimos la ganancia total ---
+
+    print("La cantidad total de euros a comisionar este més es de ", ganancia_total, "euros")
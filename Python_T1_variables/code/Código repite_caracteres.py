@@ -1,7 +1,16 @@
-# --- Pedir un string de cinco caracteres ---
-palabra = input("Ingresa una palabra de 5 caracteres: ")
+import sys
 
-print(palabra[0]+palabra[0]+palabra[1]+palabra[1]+palabra[2]+\
-    palabra[2]+palabra[3]+palabra[3]+palabra[4]+palabra[4])
-print(palabra[0]*2+palabra[1]*2+palabra[2]*2+\
-    palabra[3]*2+palabra[4]*2)
\ No newline at end of file
+import repeticion
+
+# --- Modo fichero: python "Código repite_caracteres.py" entrada.txt salida.txt [veces] ---
+if len(sys.argv) > 2:
+    veces = int(sys.argv[3]) if len(sys.argv) > 3 else 2
+    repeticion.repetir_fichero(sys.argv[1], sys.argv[2], veces)
+    print("Fichero", sys.argv[2], "creado con cada caracter repetido", veces, "veces")
+else:
+    # --- Pedir un string (ya no tiene que tener cinco caracteres) ---
+    palabra = input("Ingresa una palabra: ")
+
+    # --- Repetimos cada caracter dos veces ---
+    print(repeticion.repetir_caracteres(palabra, 2))
+    print(repeticion.repetir_numpy(palabra, 2))
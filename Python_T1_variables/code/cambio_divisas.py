@@ -0,0 +1,171 @@
+# Conversion de divisas con aritmetica exacta
+# Los importes se guardan en centimos (enteros) y los tipos de cambio y la
+# comision en millonesimas (1.2 -> 1200000), asi no hay errores de
+# redondeo de los float. Las conversiones trabajan con arrays de NumPy
+# para convertir muchos importes de una vez.
+# Fichero de tipos de cambio (CSV, una linea por par de divisas):
+#   origen,destino,tipo
+#   EUR,USD,1.2
+# Los tipos se guardan en una cache que solo vuelve a leer el fichero
+# cuando han pasado ttl segundos y el fichero ha cambiado.
+
+import csv
+import os
+import time
+from decimal import Decimal, ROUND_HALF_UP
+
+import numpy as np
+
+# tipos de cambio y comision se guardan multiplicados por ESCALA
+ESCALA = 1000000
+
+# tipos de cambio por defecto (si no hay fichero)
+TASAS = {("EUR", "USD"): "1.2"}
+
+COMISION = "0.1"
+
+
+def a_escala(valor):
+    """ Convierte un tipo o una comision ("1.2") a millonesimas (1200000) """
+
+    return int((Decimal(str(valor)) * ESCALA).to_integral_value(ROUND_HALF_UP))
+
+
+def a_centimos(importes):
+    """ Convierte importes ("12.34", 12.34, ...) a un array de centimos """
+    # INPUT:
+    # - importes: str, numero o lista de ellos
+
+    # pasamos por Decimal(str(...)) para que 0.1 sean 10 centimos exactos
+    centimos = [int((Decimal(str(importe)) * 100).to_integral_value(ROUND_HALF_UP))
+                for importe in np.atleast_1d(importes).tolist()]
+    return np.array(centimos, dtype = np.int64)
+
+
+def formatear(centimos):
+    """ Devuelve el importe en centimos como texto con dos decimales """
+
+    return str(Decimal(int(centimos)).scaleb(-2))
+
+
+def _redondear(valor):
+    """ Divide entre ESCALA redondeando la mitad alejandose del cero,
+    igual que ROUND_HALF_UP de Decimal (los negativos igual que los positivos) """
+
+    return np.sign(valor) * ((np.abs(valor) + ESCALA // 2) // ESCALA)
+
+
+def _multiplicar(centimos, factor):
+    """ Multiplica centimos por un factor en millonesimas y redondea a
+    centimos sin desbordar int64. Lanza OverflowError si algun importe
+    es demasiado grande para calcularlo con int64 """
+    # INPUT:
+    # - centimos: int o array de int
+    # - factor: int o array de int >= 0, en millonesimas
+
+    centimos = np.asarray(centimos, dtype = np.int64)
+    factor = np.asarray(factor, dtype = np.int64)
+
+    # separamos la parte entera y la decimal del factor: centimos * factor
+    # podria no caber en int64 aunque el resultado si quepa
+    entera, decimal = np.divmod(factor, ESCALA)
+
+    # centimos * decimal necesita |centimos| <= maximo / ESCALA y la suma
+    # de las dos partes |centimos| <= maximo / (entera + 1)
+    limite = np.iinfo(np.int64).max // np.maximum(entera + 1, ESCALA)
+    if np.any((centimos > limite) | (centimos < -limite)):
+        raise OverflowError("Importe demasiado grande para convertirlo con int64")
+
+    # entera y decimal tienen el mismo signo que centimos, asi que
+    # redondear solo la parte decimal es igual que redondear el total
+    return centimos * entera + _redondear(centimos * decimal)
+
+
+def cargar_tasas(ruta = None):
+    """ Lee los tipos de cambio del fichero y los devuelve como
+    {(origen, destino): tipo en millonesimas}. Sin ruta usa TASAS """
+    # INPUT:
+    # - ruta: str o None
+
+    if ruta is None:
+        return {par: a_escala(tipo) for par, tipo in TASAS.items()}
+
+    tasas = {}
+    with open(ruta, newline = "", encoding = "utf-8") as fichero:
+        for fila in csv.DictReader(fichero):
+            tasas[(fila["origen"].strip(), fila["destino"].strip())] = a_escala(fila["tipo"].strip())
+
+    return tasas
+
+
+def crear_cache(ruta = None, ttl = 60):
+    """ Crea una cache de tipos de cambio que se refresca cada ttl segundos """
+    # INPUT:
+    # - ruta: str, fichero de tipos, o None para usar TASAS
+    # - ttl: float, segundos que se usan los tipos sin mirar el fichero
+
+    cache = {
+        "ruta": ruta,
+        "ttl": ttl,
+        "tasas": None,
+        "cargado": 0.0,
+        "modificado": None
+    }
+
+    return cache
+
+
+def obtener_tasas(cache):
+    """ Devuelve los tipos de cambio de la cache, leyendo el fichero
+    solo la primera vez o si ha caducado y el fichero ha cambiado """
+
+    ahora = time.monotonic()
+    if cache["tasas"] is not None and ahora - cache["cargado"] < cache["ttl"]:
+        return cache["tasas"]
+
+    modificado = os.path.getmtime(cache["ruta"]) if cache["ruta"] is not None else None
+    if cache["tasas"] is None or modificado != cache["modificado"]:
+        cache["tasas"] = cargar_tasas(cache["ruta"])
+        cache["modificado"] = modificado
+    cache["cargado"] = ahora
+
+    return cache["tasas"]
+
+
+def convertir(centimos, tipo):
+    """ Convierte centimos de una divisa a centimos de otra """
+    # INPUT:
+    # - centimos: int o array de int (int64)
+    # - tipo: int o array de int, tipo de cambio en millonesimas
+
+    # caben importes de hasta unos 92.000 millones de unidades con
+    # cualquier tipo cuyo resultado quepa en int64
+    return _multiplicar(centimos, tipo)
+
+
+def aplicar_comision(centimos, comision = COMISION):
+    """ Devuelve (comision_cobrada, importe_recibido) en centimos """
+    # INPUT:
+    # - centimos: int o array de int
+    # - comision: str o numero, parte que se queda la casa de cambios
+
+    centimos = np.asarray(centimos, dtype = np.int64)
+    cobrada = _multiplicar(centimos, a_escala(comision))
+    return cobrada, centimos - cobrada
+
+
+def convertir_lote(centimos, origenes, destinos, tasas):
+    """ Convierte muchos importes, cada uno con su par de divisas,
+    en una sola operacion con arrays """
+    # INPUT:
+    # - centimos: array de int, importes en la divisa de origen
+    # - origenes, destinos: arrays o listas de str ("EUR", "USD", ...)
+    # - tasas: dict devuelto por cargar_tasas u obtener_tasas
+
+    pares = np.char.add(np.char.add(np.asarray(origenes, dtype = str), "/"), np.asarray(destinos, dtype = str))
+
+    # buscamos el tipo de cada par distinto una sola vez
+    pares_unicos, indices = np.unique(pares, return_inverse = True)
+    tipos = np.array([tasas[tuple(par.split("/"))] for par in pares_unicos], dtype = np.int64)
+
+    return convertir(centimos, tipos[indices.ravel()])
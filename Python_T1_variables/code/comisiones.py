@@ -0,0 +1,161 @@
+# Calculo de comisiones de los vendedores de la compañia de automoviles
+# Los modelos se guardan en una tabla con arrays de precios y comisiones,
+# asi una venta solo necesita el indice de su modelo. Las comisiones de
+# todos los vendedores se calculan de una vez agrupando con bincount.
+# Tabla de modelos:
+# {
+#   "modelos": ["RBM serie 1", ...],
+#   "indices": {"RBM serie 1": 0, ...},
+#   "precios": array([20000., ...]),
+#   "comisiones": array([0.03, ...])
+# }
+# Ademas se pueden usar tramos: segun el total vendido en el mes el
+# vendedor cobra un porcentaje extra sobre todas sus ventas.
+# Fichero de ventas (CSV con cabecera): vendedor,modelo,unidades
+
+import csv
+from itertools import islice
+
+import numpy as np
+
+# modelo: (precio, comision)
+MODELOS = {
+    "RBM serie 1": (20000, 0.03),
+    "RBM plus": (35000, 0.05),
+    "RBM todoterreno": (60000, 0.07)
+}
+
+# (limite inferior del tramo en euros vendidos, comision extra)
+TRAMOS = [(0, 0.0), (500000, 0.005), (1000000, 0.01)]
+
+
+def crear_tabla(modelos = MODELOS):
+    """ Crea la tabla de modelos a partir de {modelo: (precio, comision)} """
+
+    nombres = list(modelos)
+    tabla = {
+        "modelos": nombres,
+        "indices": {nombre: i for i, nombre in enumerate(nombres)},
+        "precios": np.array([modelos[nombre][0] for nombre in nombres], dtype = float),
+        "comisiones": np.array([modelos[nombre][1] for nombre in nombres], dtype = float)
+    }
+
+    return tabla
+
+
+def cargar_tabla(ruta):
+    """ Crea la tabla de modelos desde un CSV con cabecera modelo,precio,comision """
+
+    with open(ruta, newline = "", encoding = "utf-8") as fichero:
+        modelos = {fila["modelo"]: (float(fila["precio"]), float(fila["comision"]))
+                   for fila in csv.DictReader(fichero)}
+
+    return crear_tabla(modelos)
+
+
+def indices_modelos(tabla, modelos):
+    """ Convierte una lista de nombres de modelo en un array de indices
+    de la tabla (cada nombre distinto se busca una sola vez) """
+
+    nombres, inversa = np.unique(np.asarray(modelos, dtype = str), return_inverse = True)
+    indices = np.array([tabla["indices"][nombre] for nombre in nombres.tolist()], dtype = np.int64)
+    return indices[inversa.ravel()]
+
+
+def _agrupar(tabla, vendedores, modelos, unidades):
+    """ Devuelve (vendedores_unicos, ventas, comision_base) sumados por vendedor """
+
+    vendedores_unicos, grupos = np.unique(np.asarray(vendedores, dtype = str), return_inverse = True)
+    grupos = grupos.ravel()
+    indices = indices_modelos(tabla, modelos)
+
+    importes = np.asarray(unidades, dtype = float) * tabla["precios"][indices]
+    ventas = np.bincount(grupos, weights = importes, minlength = len(vendedores_unicos))
+    comision_base = np.bincount(grupos, weights = importes * tabla["comisiones"][indices],
+                                minlength = len(vendedores_unicos))
+
+    return vendedores_unicos, ventas, comision_base
+
+
+def comision_tramos(ventas, tramos = TRAMOS):
+    """ Devuelve la comision extra de cada vendedor segun el tramo en el
+    que cae su total vendido (el porcentaje se aplica a todas sus ventas) """
+    # INPUT:
+    # - ventas: array con el total vendido por cada vendedor
+    # - tramos: lista de (limite inferior, comision extra), ordenada
+
+    limites = np.array([limite for limite, extra in tramos], dtype = float)
+    extras = np.array([extra for limite, extra in tramos], dtype = float)
+
+    # searchsorted encuentra el tramo de todos los vendedores de una vez
+    tramo = np.searchsorted(limites, ventas, side = "right") - 1
+    return np.where(tramo >= 0, extras[np.maximum(tramo, 0)], 0.0) * ventas
+
+
+def comisiones_vendedores(tabla, vendedores, modelos, unidades, tramos = None):
+    """ Devuelve (vendedores, ventas, comisiones) con el total vendido y
+    la comision de cada vendedor """
+    # INPUT:
+    # - tabla: dict creado con crear_tabla o cargar_tabla
+    # - vendedores, modelos: listas o arrays de str, una posicion por venta
+    # - unidades: lista o array de int
+    # - tramos: lista de (limite, comision extra) o None para no usar tramos
+
+    vendedores_unicos, ventas, comisiones = _agrupar(tabla, vendedores, modelos, unidades)
+    if tramos is not None:
+        comisiones = comisiones + comision_tramos(ventas, tramos)
+
+    return vendedores_unicos, ventas, comisiones
+
+
+def _filas_validas(lector):
+    """ Devuelve (generador) las filas (vendedor, modelo, unidades) del
+    lector CSV, saltando las lineas vacias. Lanza ValueError con el
+    numero de linea si una fila no tiene 3 campos o las unidades no
+    son un entero """
+
+    for fila in lector:
+        # ignoramos las lineas vacias
+        if not fila or all(not campo.strip() for campo in fila):
+            continue
+        if len(fila) != 3:
+            raise ValueError(f"Linea {lector.line_num} mal formada (se esperaban 3 campos): {fila!r}")
+        try:
+            unidades = int(fila[2])
+        except ValueError:
+            raise ValueError(f"Linea {lector.line_num} con unidades no enteras: {fila!r}") from None
+        yield fila[0], fila[1], unidades
+
+
+def procesar_fichero(tabla, ruta, tramos = None, tamano_bloque = 1000000):
+    """ Calcula las comisiones de un fichero de ventas leyendolo por
+    bloques de tamano_bloque lineas. Devuelve lo mismo que
+    comisiones_vendedores """
+    # INPUT:
+    # - tabla: dict de la tabla de modelos
+    # - ruta: str, CSV con cabecera vendedor,modelo,unidades
+    # - tramos: lista de (limite, comision extra) o None
+    # - tamano_bloque: int
+
+    # los tramos dependen del total del mes, asi que primero acumulamos
+    # ventas y comision base de cada bloque y los aplicamos al final
+    totales = {}
+    with open(ruta, newline = "", encoding = "utf-8") as fichero:
+        lector = csv.reader(fichero)
+        next(lector, None)
+        while True:
+            filas = list(islice(_filas_validas(lector), tamano_bloque))
+            if not filas:
+                break
+            vendedores, modelos, unidades = zip(*filas)
+            for vendedor, ventas, comision in zip(*_agrupar(tabla, vendedores, modelos, np.array(unidades, dtype = np.int64))):
+                anterior = totales.get(vendedor, (0.0, 0.0))
+                totales[vendedor] = (anterior[0] + ventas, anterior[1] + comision)
+
+    vendedores = np.array(sorted(totales), dtype = str)
+    ventas = np.array([totales[vendedor][0] for vendedor in vendedores.tolist()])
+    comisiones = np.array([totales[vendedor][1] for vendedor in vendedores.tolist()])
+    if tramos is not None:
+        comisiones = comisiones + comision_tramos(ventas, tramos)
+
+    return vendedores, ventas, comisiones
@@ -0,0 +1,78 @@
+# Proyeccion de ahorros a varios años por el metodo de Monte Carlo
+# En vez de un unico calculo con ingresos y gastos fijos, se simulan
+# muchos caminos posibles: cada semana las horas trabajadas y los gastos
+# varian al azar alrededor de los valores indicados. Con NumPy se simulan
+# todos los caminos y semanas a la vez (array caminos x semanas).
+# Para no llenar la memoria con millones de caminos se simulan por bloques
+# y de cada camino solo se guarda el ahorro acumulado al final de cada año.
+
+import numpy as np
+
+SEMANAS_AÑO = 52
+
+PERCENTILES = [5, 25, 50, 75, 95]
+
+
+def ahorro_anual(ingresos_hora, horas_trabajadas, gastos_semanales):
+    """ Ahorro de un año sin variaciones (calculo de la calculadora) """
+
+    return (ingresos_hora * horas_trabajadas - gastos_semanales) * SEMANAS_AÑO
+
+
+def _simular_bloque(generador, caminos, años, ingresos_hora, horas_trabajadas, gastos_semanales,
+                    variacion_horas, variacion_gastos):
+    """ Simula un bloque de caminos y devuelve el ahorro acumulado al
+    final de cada año (array caminos x años) """
+
+    semanas = años * SEMANAS_AÑO
+
+    # horas y gastos de cada semana de cada camino (normales, nunca negativos)
+    horas = generador.normal(horas_trabajadas, horas_trabajadas * variacion_horas, (caminos, semanas))
+    gastos = generador.normal(gastos_semanales, gastos_semanales * variacion_gastos, (caminos, semanas))
+    ahorro_semanal = ingresos_hora * np.maximum(horas, 0) - np.maximum(gastos, 0)
+
+    # acumulamos semana a semana y nos quedamos con la ultima semana de cada año
+    return ahorro_semanal.cumsum(axis = 1)[:, SEMANAS_AÑO - 1::SEMANAS_AÑO]
+
+
+def proyectar(ingresos_hora, horas_trabajadas, gastos_semanales, años = 5, caminos = 10000,
+              variacion_horas = 0.1, variacion_gastos = 0.2, tamano_bloque = None, semilla = None):
+    """ Devuelve un array (caminos x años) con el ahorro acumulado al
+    final de cada año en cada camino simulado """
+    # INPUT:
+    # - ingresos_hora: float, euros por hora
+    # - horas_trabajadas: float, horas por semana (media)
+    # - gastos_semanales: float, euros por semana (media)
+    # - años: int
+    # - caminos: int, numero de simulaciones
+    # - variacion_horas, variacion_gastos: float, desviacion tipica
+    #   relativa a la media (0.1 = 10%)
+    # - tamano_bloque: int, caminos que se simulan a la vez, o None para
+    #   simularlos todos de una vez
+    # - semilla: int o None, para repetir la misma simulacion
+
+    generador = np.random.default_rng(semilla)
+    if tamano_bloque is None:
+        tamano_bloque = caminos
+
+    # solo guardamos el resultado por año, los arrays semanales son del bloque
+    saldos = np.empty((caminos, años))
+    for inicio in range(0, caminos, tamano_bloque):
+        fin = min(inicio + tamano_bloque, caminos)
+        saldos[inicio:fin] = _simular_bloque(generador, fin - inicio, años, ingresos_hora, horas_trabajadas,
+                                             gastos_semanales, variacion_horas, variacion_gastos)
+
+    return saldos
+
+
+def bandas(saldos, percentiles = PERCENTILES):
+    """ Devuelve un array (percentiles x años) con los percentiles del
+    ahorro acumulado de cada año """
+
+    return np.percentile(saldos, percentiles, axis = 0)
+
+
+def probabilidad_deficit(saldos):
+    """ Devuelve, para cada año, la proporcion de caminos con ahorro negativo """
+
+    return (saldos < 0).mean(axis = 0)
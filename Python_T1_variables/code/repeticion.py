@@ -0,0 +1,58 @@
+# Repetir cada caracter de un texto k veces ("hola", 2 -> "hhoollaa")
+# Sumar strings con + dentro de un bucle copia el texto entero cada vez
+# (coste cuadratico), por eso:
+# - repetir_caracteres usa ''.join sobre un generador (una sola copia)
+# - repetir_numpy usa np.repeat sobre los caracteres del texto, mas rapido
+#   con textos muy largos
+# - repetir_bytes hace lo mismo con bytes (uint8), por ejemplo texto ASCII
+# - repetir_fichero procesa un fichero por bloques sin cargarlo entero
+
+import numpy as np
+
+
+def repetir_caracteres(texto, veces = 2):
+    """ Devuelve el texto con cada caracter repetido veces veces """
+    # INPUT:
+    # - texto: str de cualquier longitud
+    # - veces: int >= 0
+
+    return "".join(caracter * veces for caracter in texto)
+
+
+def repetir_numpy(texto, veces = 2):
+    """ Igual que repetir_caracteres pero con np.repeat (textos grandes) """
+
+    # en utf-32 cada caracter ocupa 4 bytes, asi podemos ver el texto
+    # como un array de caracteres sueltos (dtype U1) sin copiarlo
+    caracteres = np.frombuffer(texto.encode("utf-32-le"), dtype = "<U1")
+    return np.repeat(caracteres, veces).tobytes().decode("utf-32-le")
+
+
+def repetir_bytes(datos, veces = 2):
+    """ Devuelve los bytes con cada byte repetido veces veces """
+    # INPUT:
+    # - datos: bytes (por ejemplo texto ASCII codificado)
+    # - veces: int >= 0
+
+    return np.repeat(np.frombuffer(datos, dtype = np.uint8), veces).tobytes()
+
+
+def repetir_fichero(ruta_entrada, ruta_salida, veces = 2, tamano_bloque = 1000000):
+    """ Escribe en ruta_salida el contenido de ruta_entrada con cada
+    caracter repetido. Lee por bloques de tamano_bloque caracteres, asi
+    la memoria no depende del tamaño del fichero """
+    # INPUT:
+    # - ruta_entrada, ruta_salida: str
+    # - veces: int >= 0
+    # - tamano_bloque: int
+
+    # newline = "" para no convertir los saltos de linea al leer ni al escribir
+    with open(ruta_entrada, encoding = "utf-8", newline = "") as entrada, \
+            open(ruta_salida, "w", encoding = "utf-8", newline = "") as salida:
+        while True:
+            bloque = entrada.read(tamano_bloque)
+            if not bloque:
+                break
+            # cada caracter se repite por separado, asi que los bloques
+            # se pueden procesar de forma independiente
+            salida.write(repetir_numpy(bloque, veces))
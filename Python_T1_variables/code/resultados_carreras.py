@@ -0,0 +1,177 @@
+# Analisis de resultados de carreras
+# Los tiempos llegan como texto "minutos segundos centesimas" ("1 05 23")
+# y se guardan como centesimas enteras (int64): asi las comparaciones y
+# los empates son exactos. Todas las funciones trabajan con arrays para
+# procesar de una vez los tiempos de cientos de miles de series.
+# Para seguir una carrera en directo, la clasificacion en directo es una
+# lista ordenada que se actualiza con bisect cada vez que llega un paso:
+# {
+#   "pasos": {"Hannah Neise": (punto, centesimas), ...},
+#   "orden": [(-punto, centesimas, atleta), ...]   <- ordenada, primero el lider
+# }
+
+from bisect import bisect_left, insort
+from itertools import islice
+
+import numpy as np
+
+DISTANCIA = 100.0
+
+# centesimas que vale cada columna de "minutos segundos centesimas"
+CENTESIMAS_COLUMNA = np.array([6000, 100, 1], dtype = np.int64)
+
+PERCENTILES = [10, 25, 50, 75, 90]
+
+
+def parsear_tiempos(tiempos, con_serie = False, primera_linea = 1):
+    """ Convierte una lista de tiempos "min seg cs" a un array de centesimas.
+    Con con_serie cada tiempo empieza por el numero de serie y se
+    devuelve (series, centesimas). Las lineas vacias se ignoran y si
+    alguna linea esta mal formada se lanza ValueError con su numero """
+    # INPUT:
+    # - tiempos: lista de str (o lineas de un fichero)
+    # - con_serie: bool
+    # - primera_linea: int, numero de la primera linea (para los errores)
+
+    columnas = 4 if con_serie else 3
+
+    # partimos cada linea por separado, asi una linea con campos de
+    # mas o de menos no descoloca a las siguientes
+    partes = [linea.split() for linea in tiempos]
+    longitudes = np.fromiter(map(len, partes), dtype = np.int64, count = len(partes))
+    malas = np.flatnonzero((longitudes != columnas) & (longitudes != 0))
+    if len(malas) > 0:
+        raise ValueError("Lineas mal formadas (se esperaban " + str(columnas) + " campos): " +
+                         str((malas[:10] + primera_linea).tolist()))
+
+    partes = [campos for campos in partes if campos]
+    try:
+        # convertimos todos los campos a enteros de una vez con NumPy
+        valores = np.array(partes, dtype = np.int64).reshape(-1, columnas)
+    except ValueError:
+        # buscamos la primera linea que no se puede convertir para avisar
+        numeros = [i for i, campos in enumerate(tiempos) if campos.split()]
+        for numero, campos in zip(numeros, partes):
+            if not all(campo.lstrip("+-").isdigit() for campo in campos):
+                raise ValueError("Linea " + str(numero + primera_linea) + " con valores no enteros: " +
+                                 " ".join(campos))
+        raise
+    centesimas = valores[:, -3:] @ CENTESIMAS_COLUMNA
+
+    if con_serie:
+        return valores[:, 0], centesimas
+    return centesimas
+
+
+def leer_fichero(ruta, con_serie = False, tamano_bloque = 1000000):
+    """ Lee un fichero de tiempos (uno por linea) por bloques de
+    tamano_bloque lineas y devuelve (generador) el resultado de
+    parsear_tiempos de cada bloque """
+    # INPUT:
+    # - ruta: str
+    # - con_serie: bool, si cada linea empieza por el numero de serie
+    # - tamano_bloque: int
+
+    with open(ruta, encoding = "utf-8") as fichero:
+        primera_linea = 1
+        while True:
+            lineas = list(islice(fichero, tamano_bloque))
+            if not lineas:
+                break
+            yield parsear_tiempos(lineas, con_serie, primera_linea)
+            primera_linea += len(lineas)
+
+
+def velocidades(centesimas, distancia = DISTANCIA):
+    """ Devuelve la velocidad media (metros por segundo) de cada tiempo """
+
+    return distancia / (np.asarray(centesimas) / 100)
+
+
+def clasificacion(centesimas):
+    """ Devuelve (orden, puestos): los indices de los tiempos del mas
+    rapido al mas lento y el puesto de cada tiempo (empates con el
+    mismo puesto) """
+
+    centesimas = np.asarray(centesimas)
+    orden = np.argsort(centesimas, kind = "stable")
+    # el puesto es el numero de tiempos mas rapidos mas uno
+    puestos = np.searchsorted(centesimas[orden], centesimas, side = "left") + 1
+
+    return orden, puestos
+
+
+def clasificacion_por_serie(series, centesimas):
+    """ Devuelve el puesto de cada tiempo dentro de su serie (empates
+    con el mismo puesto, igual que clasificacion) """
+    # INPUT:
+    # - series: array de int, serie de cada tiempo
+    # - centesimas: array de int
+
+    series = np.asarray(series)
+    centesimas = np.asarray(centesimas)
+
+    # ordenamos por serie y, dentro de cada serie, por tiempo
+    orden = np.lexsort((centesimas, series))
+    series_ordenadas = series[orden]
+    tiempos_ordenados = centesimas[orden]
+    posiciones = np.arange(len(orden))
+
+    # posicion donde empieza cada serie dentro del orden
+    nueva_serie = np.ones(len(orden), dtype = bool)
+    nueva_serie[1:] = series_ordenadas[1:] != series_ordenadas[:-1]
+    inicios = np.maximum.accumulate(np.where(nueva_serie, posiciones, 0))
+
+    # posicion del primer tiempo de cada grupo de empatados
+    nuevo_tiempo = nueva_serie.copy()
+    nuevo_tiempo[1:] |= tiempos_ordenados[1:] != tiempos_ordenados[:-1]
+    primeros = np.maximum.accumulate(np.where(nuevo_tiempo, posiciones, 0))
+
+    puestos = np.empty(len(orden), dtype = np.int64)
+    puestos[orden] = primeros - inicios + 1
+
+    return puestos
+
+
+def percentiles_tiempos(centesimas, percentiles = PERCENTILES):
+    """ Devuelve los percentiles de los tiempos, en segundos """
+
+    return np.percentile(np.asarray(centesimas), percentiles) / 100
+
+
+def crear_clasificacion_directo():
+    """ Crea una clasificacion en directo vacia """
+
+    return {"pasos": {}, "orden": []}
+
+
+def registrar_paso(clasificacion, atleta, punto, centesimas):
+    """ Registra que el atleta ha pasado por el punto (metros o numero
+    de paso) con el tiempo indicado y recoloca al atleta """
+    # INPUT:
+    # - clasificacion: dict creado con crear_clasificacion_directo
+    # - atleta: str
+    # - punto: int o float, cuanto mas alto mas avanzada la carrera
+    # - centesimas: int, tiempo en ese punto
+
+    # va delante quien ha llegado mas lejos y, con el mismo punto, quien antes
+    anterior = clasificacion["pasos"].get(atleta)
+    if anterior is not None:
+        clave = (-anterior[0], anterior[1], atleta)
+        del clasificacion["orden"][bisect_left(clasificacion["orden"], clave)]
+
+    clasificacion["pasos"][atleta] = (punto, centesimas)
+    insort(clasificacion["orden"], (-punto, centesimas, atleta))
+
+
+def posicion_directo(clasificacion, atleta):
+    """ Devuelve el puesto actual del atleta (empezando en 1) """
+
+    punto, centesimas = clasificacion["pasos"][atleta]
+    return bisect_left(clasificacion["orden"], (-punto, centesimas, atleta)) + 1
+
+
+def lideres(clasificacion, cantidad = 3):
+    """ Devuelve los primeros atletas como lista de (atleta, punto, centesimas) """
+
+    return [(atleta, -punto, centesimas) for punto, centesimas, atleta in clasificacion["orden"][:cantidad]]
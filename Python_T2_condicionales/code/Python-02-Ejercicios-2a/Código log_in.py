@@ -1,22 +1,41 @@
-# --- Tenemos la contraseña correcta
-key = "micontraseña123"
+import hashlib
+import hmac
+
+# --- No guardamos la contraseña correcta, solo una sal aleatoria y el
+# hash PBKDF2 de la contraseña con esa sal, calculados una sola vez con:
+# sal = os.urandom(16)
+# hashlib.pbkdf2_hmac("sha256", contraseña.encode("utf-8"), sal, ITERACIONES)
+ITERACIONES = 600000
+sal = bytes.fromhex("de6d390ef81cdf608c04f63c34844a78")
+key_hash = bytes.fromhex("b703702492b349c64bb356f3277bf13cb5b45c260ff298de4fc3edd8757c0f77")
+
+
+def password_correcto(password):
+    """ Comprueba la contraseña comparando su hash con el guardado """
+    # INPUT:
+    # - password: str
+
+    password_hash = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), sal, ITERACIONES)
+    # compare_digest tarda lo mismo aunque los hashes difieran al principio
+    return hmac.compare_digest(password_hash, key_hash)
+
 
 # --- Pedimos al usuario la contraseña
 password = input("Introduce la contraseña: ")
 
 # --- Comprobamos que el password introducido coincide con nuestra key
-if password.lower() == key:
+# (sin pasarlo a minusculas: las mayusculas tambien cuentan)
+if password_correcto(password):
 # Si coincide damos la bienvenida
     print("Contraseña correcta. ¡Bienvenido!")
 else:
 # Si no coincide damos un error y pedimos la contraseña de nuevo
     print("Error, la contraseña no es correcta")
     password = input("Introduzca la cintraseña de nuevo: ")
-    if password.lower() == key:
+    if password_correcto(password):
         ## si esta vez la contraseña coincide damos la bienvenida
         print("Contraseña correcta. ¡Bienvenido!")
     else:
         ## si no damos un mensaje de error y se termina el programa
         print("Error, la contaseña no es correcta")
         print("Cerramos el sistema")
-
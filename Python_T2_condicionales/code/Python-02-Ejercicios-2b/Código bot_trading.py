@@ -1,10 +1,14 @@
+import backtest_trading
+
 # ---- Pedimos un precio al usuario
 precio = float(input("Ingresa el precio en dolares: "))
 
 # --- Comprobar el precio y ver si debemos comprar, holderar o vender
-if precio < 100.0:
+# (la misma regla que se usa en backtest_trading para las series historicas)
+senal = backtest_trading.senales(precio, umbral_compra = 100.0, umbral_venta = 150.0)
+if senal == backtest_trading.COMPRAR:
     print("Es hora de comprar")
-elif 100.0 <= precio <= 150.0:
+elif senal == backtest_trading.HOLDEAR:
     print("Toca holdear")
 else:
     print("Es hora de vender")
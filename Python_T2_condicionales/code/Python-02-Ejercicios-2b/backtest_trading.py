@@ -0,0 +1,100 @@
+# Backtesting de la regla del bot de trading
+# Regla: precio < umbral_compra --> comprar
+#        umbral_compra <= precio <= umbral_venta --> holdear
+#        precio > umbral_venta --> vender
+# Las señales se codifican como 1 (comprar), 0 (holdear) y -1 (vender).
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import product
+
+import numpy as np
+
+COMPRAR = 1
+HOLDEAR = 0
+VENDER = -1
+
+
+def cargar_precios(ruta):
+    """ Carga una serie de precios guardada con np.save (.npy)
+    proyectandola en memoria, sin leer todo el fichero """
+    # INPUT:
+    # - ruta: str, fichero .npy
+
+    return np.load(ruta, mmap_mode = "r")
+
+
+def senales(precios, umbral_compra = 100.0, umbral_venta = 150.0):
+    """ Devuelve la señal de la regla para cada precio """
+    # INPUT:
+    # - precios: numero o array de precios
+    # - umbral_compra, umbral_venta: float
+
+    precios = np.asarray(precios)
+    return np.where(precios < umbral_compra, COMPRAR,
+                    np.where(precios > umbral_venta, VENDER, HOLDEAR))
+
+
+def posiciones(senales_precios):
+    """ Devuelve 1 en cada instante en que estamos comprados y 0 si no.
+    Comprar abre la posicion, vender la cierra y holdear mantiene
+    la posicion anterior (al principio no estamos comprados) """
+    # INPUT:
+    # - senales_precios: array de señales
+
+    # para cada instante buscamos el indice de la ultima señal distinta de
+    # holdear: nos quedamos con su indice y arrastramos el maximo acumulado
+    indices = np.where(senales_precios != HOLDEAR, np.arange(len(senales_precios)), 0)
+    ultima_senal = senales_precios[np.maximum.accumulate(indices)]
+
+    return (ultima_senal == COMPRAR).astype(np.int8)
+
+
+def rentabilidad(precios, umbral_compra = 100.0, umbral_venta = 150.0):
+    """ Devuelve la rentabilidad total de la estrategia
+    (0.1 significa un 10% de ganancia) """
+    # INPUT:
+    # - precios: array de precios
+    # - umbral_compra, umbral_venta: float
+
+    precios = np.asarray(precios, dtype = float)
+    if len(precios) < 2:
+        return 0.0
+
+    posicion = posiciones(senales(precios, umbral_compra, umbral_venta))
+
+    # estando comprados en el instante i ganamos la variacion hasta i+1
+    variaciones = precios[1:] / precios[:-1]
+    variaciones_estrategia = np.where(posicion[:-1] == 1, variaciones, 1.0)
+
+    # sumamos logaritmos en vez de multiplicar para no perder precision
+    return float(np.expm1(np.sum(np.log(variaciones_estrategia))))
+
+
+def _rentabilidad_fichero(ruta, umbrales):
+    """ Calcula la rentabilidad de un par de umbrales cargando los precios
+    del fichero (se ejecuta en cada proceso) """
+
+    umbral_compra, umbral_venta = umbrales
+    return umbral_compra, umbral_venta, rentabilidad(cargar_precios(ruta), umbral_compra, umbral_venta)
+
+
+def busqueda_rejilla(ruta, umbrales_compra, umbrales_venta, procesos = None):
+    """ Prueba todas las combinaciones de umbrales repartiendolas entre
+    varios procesos y devuelve la lista de (umbral_compra, umbral_venta,
+    rentabilidad) ordenada de mejor a peor """
+    # INPUT:
+    # - ruta: str, fichero .npy con los precios (cada proceso lo proyecta
+    #   en memoria, asi no hay que enviarle el array)
+    # - umbrales_compra, umbrales_venta: listas de float
+    # - procesos: int, numero de procesos (por defecto uno por nucleo)
+
+    # solo tienen sentido las combinaciones con compra <= venta
+    combinaciones = [(compra, venta) for compra, venta in product(umbrales_compra, umbrales_venta)
+                     if compra <= venta]
+
+    with ProcessPoolExecutor(max_workers = procesos) as ejecutor:
+        resultados = list(ejecutor.map(partial(_rentabilidad_fichero, ruta), combinaciones,
+                                       chunksize = max(1, len(combinaciones) // 64)))
+
+    return sorted(resultados, key = lambda resultado: resultado[2], reverse = True)
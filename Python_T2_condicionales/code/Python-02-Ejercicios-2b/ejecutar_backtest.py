@@ -0,0 +1,37 @@
+""" Busqueda de los mejores umbrales del bot de trading sobre
+una serie historica de precios.
+
+Uso: python ejecutar_backtest.py [precios.npy]
+Si no se indica fichero se genera una serie de precios aleatoria.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import backtest_trading
+
+# el codigo principal va dentro de este if porque los procesos de
+# ProcessPoolExecutor vuelven a importar este fichero al arrancar
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        ruta = sys.argv[1]
+    else:
+        # paseo aleatorio alrededor de 125 dolares
+        generador = np.random.default_rng(0)
+        precios = 125 * np.exp(np.cumsum(generador.normal(0, 0.001, 1000000)))
+        ruta = "precios_aleatorios.npy"
+        np.save(ruta, precios)
+
+    umbrales_compra = list(range(80, 130, 5))
+    umbrales_venta = list(range(110, 200, 5))
+
+    inicio = time.perf_counter()
+    resultados = backtest_trading.busqueda_rejilla(ruta, umbrales_compra, umbrales_venta)
+    segundos = time.perf_counter() - inicio
+
+    print(f"Probadas {len(resultados)} combinaciones en {segundos:.2f} s")
+    print("Mejores umbrales:")
+    for umbral_compra, umbral_venta, ganancia in resultados[:5]:
+        print(f"Comprar < {umbral_compra}, vender > {umbral_venta}: {ganancia * 100:.2f}%")
@@ -1,3 +1,5 @@
+import motor_impuestos
+
 # --- Pedir datos al usuario
 # edad
 edad = int(input("Ingresa tu edad: "))
@@ -11,17 +13,12 @@ if edad>=18 and ingreso>1000:
     print("Eres susceptible de tributar.")
     ## calcular su renta anual  
     renta_anual = ingreso * 12
-    ## comprobar en que tramo se encuentra su ingreso anual
-    if renta_anual < 15000:
-        print("Tu tipo impositivo es del 5%")
-    elif 15000 <= renta_anual < 25000:
-        print("Tu tipo impositivo es del 15%")
-    elif 25000 <= renta_anual < 35000:
-        print("Tu tipo impositivo es del 20%")
-    elif 35000 <= renta_anual < 60000:
-        print("Tu tipo impositivo es del 30%")
-    else:
-        print("Tu tipo impositivo es del 45%")
+    ## buscar en la tabla de tramos el tipo de su ingreso anual
+    tipo = motor_impuestos.tipo_impositivo(renta_anual)
+    print(f"Tu tipo impositivo es del {tipo * 100:g}%")
+    ## impuesto aplicando a cada parte de la renta el tipo de su tramo
+    impuesto = motor_impuestos.impuesto_progresivo(renta_anual)
+    print(f"Tu impuesto anual por tramos es de {impuesto:.2f} euros")
 
 # Si el usuario no esta en el rango de edad o ingresos
 else:
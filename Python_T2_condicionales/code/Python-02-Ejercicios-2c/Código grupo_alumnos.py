@@ -1,29 +1,33 @@
-# --- Pedir por pantalla los datos
-#chico/chica
-genero = input("Ingresa tu genero (chica/chico): ")
-#nombre
-nombre = input("Ingresa tu nombre: ")
-nombres_chicas_A = "EHIJKLM"
-nombres_chicos_A = "ABCDEFGHRSTUVWXYZ"
+import sys
 
-# --- Elegir grupo que corresponde
-# chica
-if genero.lower() == "chica":
-    ## E hasta M --> grupo A
-    if nombre[0].upper() in nombres_chicas_A:
-        print("Tu grupo es el A")
-    ## el resto --> grupo B
-    else:
-        print("Tu grupo es el B")
+import reglas_grupos
+
+# --- Reglas de asignacion (ver reglas_grupos.REGLAS)
+# chica: E hasta M --> grupo A, el resto --> grupo B
+# chico: A hasta H, R hasta Z --> grupo A, el resto --> grupo B
+reglas = reglas_grupos.compilar_reglas(reglas_grupos.REGLAS)
 
-# chico
-elif genero.lower() == "chico":
-    ## A hasta H, R hasta Z --> grupo A
-    if nombre[0].upper() in nombres_chicos_A:
-        print("Tu grupo es el A")
-    ## el resto --> grupo B
-    else: 
-        print("tu grupo es el B")
+# --- Modo matricula completa: python "Código grupo_alumnos.py" alumnos.csv grupos.csv
+# (alumnos.csv tiene una linea "nombre,genero" por alumno)
+if len(sys.argv) > 2:
+    conteo = reglas_grupos.asignar_fichero(reglas, sys.argv[1], sys.argv[2])
+    for grupo, (alumnos, porcentaje) in reglas_grupos.balance_grupos(conteo).items():
+        print(f"Grupo {grupo}: {alumnos} alumnos ({porcentaje:.1f}%)")
+    sin_grupo = sum(alumnos for (genero, grupo), alumnos in conteo.items() if grupo is None)
+    if sin_grupo > 0:
+        print(f"{sin_grupo} alumnos sin grupo por tener un genero no valido")
 
 else:
-    print("ERROR: Vuelva a inicializar el programa e introduzca un genero válido")
+    # --- Pedir por pantalla los datos
+    #chico/chica
+    genero = input("Ingresa tu genero (chica/chico): ")
+    #nombre
+    nombre = input("Ingresa tu nombre: ")
+
+    # --- Elegir grupo que corresponde buscando (genero, inicial) en la tabla
+    grupo = reglas_grupos.asignar_grupo(reglas, genero, nombre)
+
+    if grupo is not None:
+        print("Tu grupo es el", grupo)
+    else:
+        print("ERROR: Vuelva a inicializar el programa e introduzca un genero válido")
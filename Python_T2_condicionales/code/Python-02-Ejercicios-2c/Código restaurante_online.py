@@ -1,34 +1,27 @@
+import motor_menu
+
+# --- Preparamos el menu una sola vez (claves normalizadas en minusculas)
+menu = motor_menu.compilar_menu(motor_menu.MENU)
+
 # --- Pedir al usuario el tipo de hamburguesa
-hamburguesa = input("Que tipo de hamburguesa quieres? (clasica/vegana): ")
+hamburguesa = input("Que tipo de hamburguesa quieres? (" + "/".join(menu) + "): ")
 
-# --- Comprobamos que hamburguesa ha pedido el usuario
-# Si ha elegido la clasica
-if hamburguesa.lower() == "clasica":
-    ## Ofrecemos la opción de elegir un ingresiente extra: queso, bacon, huevo
-    ingrediente_extra = input("Los ingredientes extra disponibles son: Queso idiazabal, Bacon, Huevo. Elige un ingrediente extra. ") 
-    ## Imprimiremos que tipo de hamburguesa ha elegido
-    if ingrediente_extra.lower() == "queso idiazabal":
-        print("Has elegido una hamburguesa clasica con queso idiazabal")
-    elif ingrediente_extra.lower() == "bacon":
-        print("Has elegido una hamburguesa clasica con bacon")
-    elif ingrediente_extra.lower() == "huevo":
-        print("Has elegido una hamburguesa clasica con huevo")
-    else:
-        print("El ingrediente selecionado no esta disponible")
+# --- Comprobamos que hamburguesa ha pedido el usuario buscandola en el menu
+if motor_menu.normalizar(hamburguesa) in menu:
+    ## Ofrecemos la opción de elegir un ingrediente extra de esa hamburguesa
+    disponibles = [nombre for nombre, precio in menu[motor_menu.normalizar(hamburguesa)]["extras"].values()]
+    ingrediente_extra = input("Los ingredientes extra disponibles son: " + ", ".join(disponibles) + ". Elige un ingrediente extra. ")
 
-#Si ha elegido la vegana
-elif hamburguesa.lower() == "vegana":
-## Ofrecemos la opción de elegir un ingresiente extra: tofu, cebolla caramelizada
-    ingrediente_extra = input("Los ingredientes extra disponibles son: Tofu,Cebolla caramelizada. Elige un ingrediente extra. ") 
+    ## Validamos el pedido completo
+    pedido = motor_menu.validar_pedido(menu, hamburguesa, [ingrediente_extra])
     ## Imprimiremos que tipo de hamburguesa ha elegido
-    if ingrediente_extra.lower() == "tofu":
-        print("Has elegido una hamburguesa vegana con tofu")
-    elif ingrediente_extra.lower() == "cebolla caramelizada":
-        print("Has elegido una hamburguesa vegana con cebolla caramelizada")
+    if pedido["valido"]:
+        print(f"Has elegido una hamburguesa {pedido['hamburguesa']} con {pedido['extras'][0].lower()}")
+        print(f"Precio total: {pedido['precio']:.2f} euros")
     else:
-        print("El ingrediente selecionado no esta disponible")
+        print(pedido["error"])
 
-#Si no elige ninguna de las dos
+#Si no elige ninguna de las disponibles
 else:
     ## Imprimiremos un mensaje de error
-    print("Ese tipo de hamburguesa no esta disponible. Por favor vuelve a iniciar tu pedido ")
\ No newline at end of file
+    print("Ese tipo de hamburguesa no esta disponible. Por favor vuelve a iniciar tu pedido ")
@@ -0,0 +1,108 @@
+# Motor de calculo de impuestos por tramos
+# Los tramos se describen con dos arrays:
+# - limites: renta anual a partir de la que empieza cada tramo (sin el 0 inicial)
+# - tipos: tipo impositivo de cada tramo (uno mas que limites)
+# Por ejemplo con limites = [15000, 25000] y tipos = [0.05, 0.15, 0.20]:
+#   renta < 15000          --> 5%
+#   15000 <= renta < 25000 --> 15%
+#   renta >= 25000         --> 20%
+
+from itertools import islice
+
+import numpy as np
+
+# Tramos del ejercicio de declaracion de la renta
+LIMITES = np.array([15000, 25000, 35000, 60000], dtype = float)
+TIPOS = np.array([0.05, 0.15, 0.20, 0.30, 0.45])
+
+
+def cargar_tramos(ruta):
+    """ Carga una tabla de tramos desde un fichero con una linea
+    "limite_inferior,tipo" por tramo (tipo en %), empezando por 0:
+        0,5
+        15000,15
+    Devuelve (limites, tipos) """
+    # INPUT:
+    # - ruta: str, ruta del fichero de tramos
+
+    tabla = np.loadtxt(ruta, delimiter = ",", ndmin = 2)
+    limites = tabla[1:, 0]
+    tipos = tabla[:, 1] / 100
+
+    return limites, tipos
+
+
+def tipo_impositivo(rentas, limites = LIMITES, tipos = TIPOS):
+    """ Devuelve el tipo impositivo de cada renta anual """
+    # INPUT:
+    # - rentas: numero o array de rentas anuales
+    # - limites, tipos: tabla de tramos
+
+    # searchsorted devuelve el numero de limites que son <= renta,
+    # que es justo el indice del tramo
+    tramo = np.searchsorted(limites, rentas, side = "right")
+    return tipos[tramo]
+
+
+def impuesto_progresivo(rentas, limites = LIMITES, tipos = TIPOS):
+    """ Devuelve el impuesto a pagar por cada renta anual aplicando
+    a cada parte de la renta el tipo de su tramo """
+    # INPUT:
+    # - rentas: numero o array de rentas anuales
+    # - limites, tipos: tabla de tramos
+
+    rentas = np.asarray(rentas, dtype = float)
+
+    # inicio de cada tramo e impuesto acumulado al empezar cada tramo
+    inicios = np.concatenate(([0.0], limites))
+    acumulado = np.concatenate(([0.0], np.cumsum(np.diff(inicios) * tipos[:-1])))
+
+    tramo = np.searchsorted(limites, rentas, side = "right")
+    return acumulado[tramo] + tipos[tramo] * (rentas - inicios[tramo])
+
+
+def procesar_fichero(ruta_entrada, ruta_salida, limites = LIMITES, tipos = TIPOS, tamano_bloque = 1000000):
+    """ Lee un fichero de contribuyentes "identificador,renta_anual" por
+    bloques y escribe "identificador,renta_anual,tipo,impuesto".
+    Devuelve el numero de contribuyentes procesados """
+    # INPUT:
+    # - ruta_entrada, ruta_salida: str
+    # - limites, tipos: tabla de tramos
+    # - tamano_bloque: int, lineas que se procesan de una vez
+
+    total = 0
+    numero_linea = 0
+    with open(ruta_entrada, encoding = "utf-8") as entrada, open(ruta_salida, "w", encoding = "utf-8") as salida:
+        while True:
+            lineas = list(islice(entrada, tamano_bloque))
+            if not lineas:
+                break
+
+            # separamos identificadores y rentas del bloque, saltando las
+            # lineas vacias y avisando con su numero de las mal formadas
+            identificadores = []
+            rentas = []
+            for linea in lineas:
+                numero_linea += 1
+                linea = linea.strip()
+                if not linea:
+                    continue
+                try:
+                    identificador, renta = linea.rsplit(",", 1)
+                    rentas.append(float(renta))
+                except ValueError:
+                    raise ValueError(f"Linea {numero_linea} mal formada: {linea!r}") from None
+                identificadores.append(identificador)
+            if not rentas:
+                continue
+            rentas = np.array(rentas, dtype = float)
+
+            # calculamos todo el bloque de una vez
+            tipos_bloque = tipo_impositivo(rentas, limites, tipos)
+            impuestos = impuesto_progresivo(rentas, limites, tipos)
+
+            salida.writelines(f"{identificadores[i]},{rentas[i]:.2f},{tipos_bloque[i] * 100:g},{impuestos[i]:.2f}\n"
+                              for i in range(len(rentas)))
+            total += len(rentas)
+
+    return total
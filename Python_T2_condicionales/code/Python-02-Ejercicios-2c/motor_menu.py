@@ -0,0 +1,156 @@
+# Motor de pedidos del restaurante online
+# El menu es un diccionario (se puede cargar de un fichero JSON):
+# {
+#   "clasica": {"precio": 9.0, "extras": {"Queso idiazabal": 1.5, ...}},
+#   ...
+# }
+# Antes de usarlo se compila en diccionarios con las claves ya normalizadas
+# (sin espacios a los lados y en minusculas), asi cada pedido se valida con
+# busquedas en diccionarios en vez de cadenas de if/elif.
+
+import asyncio
+import json
+
+# Menu del ejercicio (precios de ejemplo)
+MENU = {
+    "clasica": {
+        "precio": 9.0,
+        "extras": {"Queso idiazabal": 1.5, "Bacon": 1.0, "Huevo": 0.8}
+    },
+    "vegana": {
+        "precio": 10.0,
+        "extras": {"Tofu": 1.2, "Cebolla caramelizada": 0.9}
+    }
+}
+
+
+def normalizar(texto):
+    """ Quita espacios a los lados y pasa a minusculas """
+
+    return texto.strip().lower()
+
+
+def cargar_menu(ruta):
+    """ Carga un menu desde un fichero JSON con el formato de MENU """
+
+    with open(ruta, encoding = "utf-8") as fichero:
+        return json.load(fichero)
+
+
+def compilar_menu(menu = MENU):
+    """ Prepara el menu para validar pedidos:
+    {"hamburguesa normalizada": {"nombre", "precio", "extras": {"extra normalizado": (nombre, precio)}}} """
+    # INPUT:
+    # - menu: dict con el formato de MENU
+
+    compilado = {}
+    for hamburguesa, datos in menu.items():
+        compilado[normalizar(hamburguesa)] = {
+            "nombre": hamburguesa,
+            "precio": datos["precio"],
+            "extras": {normalizar(extra): (extra, precio) for extra, precio in datos["extras"].items()}
+        }
+
+    return compilado
+
+
+def validar_pedido(menu_compilado, hamburguesa, extras):
+    """ Valida un pedido y calcula su precio. Devuelve un diccionario
+    {"valido": bool, "error": mensaje o None, "hamburguesa": nombre,
+     "extras": [nombres], "precio": total} """
+    # INPUT:
+    # - menu_compilado: dict creado con compilar_menu
+    # - hamburguesa: str, tipo de hamburguesa
+    # - extras: lista de str con los ingredientes extra
+
+    resultado = {"valido": False, "error": None, "hamburguesa": None, "extras": [], "precio": 0.0}
+
+    datos = menu_compilado.get(normalizar(hamburguesa))
+    if datos is None:
+        resultado["error"] = "Ese tipo de hamburguesa no esta disponible"
+        return resultado
+
+    resultado["hamburguesa"] = datos["nombre"]
+    precio = datos["precio"]
+    for extra in extras:
+        encontrado = datos["extras"].get(normalizar(extra))
+        if encontrado is None:
+            resultado["error"] = "El ingrediente selecionado no esta disponible"
+            return resultado
+        resultado["extras"].append(encontrado[0])
+        precio += encontrado[1]
+
+    resultado["valido"] = True
+    resultado["precio"] = precio
+    return resultado
+
+
+def _validar_seguro(menu_compilado, pedido):
+    """ Valida un pedido y, si esta mal formado (por ejemplo la
+    hamburguesa no es un str), devuelve un resultado no valido """
+
+    try:
+        hamburguesa, extras = pedido
+        return validar_pedido(menu_compilado, hamburguesa, extras)
+    except Exception as error:
+        return {"valido": False, "error": "Pedido mal formado: " + repr(error),
+                "hamburguesa": None, "extras": [], "precio": 0.0}
+
+
+def validar_lote(menu_compilado, pedidos):
+    """ Valida una lista de pedidos (hamburguesa, extras) y devuelve
+    la lista de resultados en el mismo orden. Un pedido mal formado no
+    impide validar los demas """
+
+    return [_validar_seguro(menu_compilado, pedido) for pedido in pedidos]
+
+
+async def _sesion(id_sesion, pedidos, cola):
+    """ Simula una sesion de cliente que envia sus pedidos a la cola """
+
+    for pedido in pedidos:
+        await cola.put((id_sesion, pedido))
+        # cedemos el turno para que avancen las demas sesiones
+        await asyncio.sleep(0)
+
+
+async def _validador(menu_compilado, cola, resultados, tamano_lote):
+    """ Saca pedidos de la cola y los valida por lotes """
+
+    while True:
+        # esperamos al menos un pedido y juntamos los que ya esten en la cola
+        lote = [await cola.get()]
+        while len(lote) < tamano_lote and not cola.empty():
+            lote.append(cola.get_nowait())
+
+        # task_done va en finally: si algo falla, cola.join() no se
+        # queda esperando para siempre los pedidos del lote
+        try:
+            validados = validar_lote(menu_compilado, [pedido for id_sesion, pedido in lote])
+            for (id_sesion, pedido), resultado in zip(lote, validados):
+                resultados.setdefault(id_sesion, []).append(resultado)
+        finally:
+            for _ in lote:
+                cola.task_done()
+
+
+async def recibir_pedidos(menu_compilado, sesiones, tamano_lote = 100):
+    """ Atiende a la vez varias sesiones de clientes. sesiones es un
+    diccionario {id_sesion: [(hamburguesa, extras), ...]}.
+    Devuelve {id_sesion: [resultado, ...]} """
+    # INPUT:
+    # - menu_compilado: dict creado con compilar_menu
+    # - sesiones: dict de listas de pedidos
+    # - tamano_lote: int, maximo de pedidos que se validan de una vez
+
+    cola = asyncio.Queue()
+    resultados = {}
+
+    validador = asyncio.create_task(_validador(menu_compilado, cola, resultados, tamano_lote))
+    await asyncio.gather(*(_sesion(id_sesion, pedidos, cola) for id_sesion, pedidos in sesiones.items()))
+
+    # esperamos a que se validen todos los pedidos y paramos el validador
+    await cola.join()
+    validador.cancel()
+
+    return resultados
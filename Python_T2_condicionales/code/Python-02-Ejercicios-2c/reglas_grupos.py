@@ -0,0 +1,84 @@
+# Asignacion de grupos de alumnos con una tabla de reglas
+# Cada regla indica, para una categoria, las iniciales que van al grupo
+# principal y el grupo para el resto:
+#   "chica": ("EHIJKLM", "A", "B") --> iniciales E,H,I,J,K,L,M al grupo A, el resto al B
+# Las reglas se compilan en un diccionario {(categoria, inicial): grupo},
+# asi cada alumno se asigna con una sola busqueda.
+
+import string
+from collections import Counter
+
+# Reglas del ejercicio
+REGLAS = {
+    "chica": ("EHIJKLM", "A", "B"),
+    "chico": ("ABCDEFGHRSTUVWXYZ", "A", "B")
+}
+
+
+def compilar_reglas(reglas = REGLAS):
+    """ Compila las reglas en (tabla, grupos_por_defecto) donde tabla es
+    {(categoria, inicial): grupo} y grupos_por_defecto {categoria: grupo}
+    para las iniciales que no son letras de la A a la Z """
+    # INPUT:
+    # - reglas: dict con el formato de REGLAS
+
+    tabla = {}
+    grupos_por_defecto = {}
+    for categoria, (iniciales, grupo, grupo_resto) in reglas.items():
+        for letra in string.ascii_uppercase:
+            tabla[(categoria, letra)] = grupo if letra in iniciales else grupo_resto
+        grupos_por_defecto[categoria] = grupo_resto
+
+    return tabla, grupos_por_defecto
+
+
+def asignar_grupo(reglas_compiladas, categoria, nombre):
+    """ Devuelve el grupo del alumno, o None si la categoria no existe """
+    # INPUT:
+    # - reglas_compiladas: resultado de compilar_reglas
+    # - categoria: str (por ejemplo "chica" o "chico")
+    # - nombre: str
+
+    tabla, grupos_por_defecto = reglas_compiladas
+    categoria = categoria.strip().lower()
+    if categoria not in grupos_por_defecto:
+        return None
+
+    inicial = nombre.strip()[:1].upper()
+    return tabla.get((categoria, inicial), grupos_por_defecto[categoria])
+
+
+def asignar_fichero(reglas_compiladas, ruta_entrada, ruta_salida):
+    """ Asigna grupo a todos los alumnos de un fichero "nombre,categoria"
+    y escribe "nombre,categoria,grupo" (grupo vacio si la categoria no es
+    valida). Devuelve un Counter {(categoria, grupo): alumnos} """
+    # INPUT:
+    # - reglas_compiladas: resultado de compilar_reglas
+    # - ruta_entrada, ruta_salida: str
+
+    conteo = Counter()
+    with open(ruta_entrada, encoding = "utf-8") as entrada, open(ruta_salida, "w", encoding = "utf-8") as salida:
+        for linea in entrada:
+            linea = linea.strip()
+            if not linea:
+                continue
+
+            nombre, categoria = linea.rsplit(",", 1)
+            grupo = asignar_grupo(reglas_compiladas, categoria, nombre)
+            conteo[(categoria.strip().lower(), grupo)] += 1
+            salida.write(f"{nombre},{categoria},{grupo or ''}\n")
+
+    return conteo
+
+
+def balance_grupos(conteo):
+    """ Devuelve {grupo: (alumnos, porcentaje)} a partir del conteo de
+    asignar_fichero (los alumnos sin grupo no se cuentan) """
+
+    por_grupo = Counter()
+    for (categoria, grupo), alumnos in conteo.items():
+        if grupo is not None:
+            por_grupo[grupo] += alumnos
+
+    total = sum(por_grupo.values())
+    return {grupo: (alumnos, alumnos / total * 100) for grupo, alumnos in sorted(por_grupo.items())}
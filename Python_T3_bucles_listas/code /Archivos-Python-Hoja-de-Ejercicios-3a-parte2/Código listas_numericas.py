@@ -1,3 +1,5 @@
+import tuberia
+
 # --- Paso 1
 
 #numeros = [1,2,3,4,5,6,7,8,9,10]
@@ -47,4 +49,24 @@ indice_8_original = numeros.index(8)
 indice_8_invertida = numeros_pares_invertidos.index(8)
 
 print(indice_8_original)
-print(indice_8_invertida)
\ No newline at end of file
+print(indice_8_invertida)
+
+print("-------")
+# --- Pasos 2 al 7 sin listas intermedias (tuberia perezosa)
+
+# pares invertidos: recorremos el range al reves, sin crear la lista invertida
+pares_invertidos = tuberia.filtrar(tuberia.crear_tuberia(range(10, 0, -1)), lambda numero: numero % 2 == 0)
+print(list(tuberia.ejecutar(pares_invertidos)))
+
+# suma de los cuadrados de los pares: cada numero pasa por todas las etapas
+# antes de leer el siguiente, asi la memoria no depende de cuantos numeros haya
+cuadrados_pares = tuberia.transformar(pares_invertidos, lambda numero: numero**2)
+print(tuberia.sumar(cuadrados_pares))
+
+# la misma cuenta con NumPy por bloques, para rangos muy grandes
+# (NumPy usa int64: si un cuadrado no cabe, sumar_numpy lanza OverflowError
+# en vez de dar un resultado equivocado; con exacto = True no hay limite)
+cuadrados_pares_numpy = tuberia.transformar(
+    tuberia.filtrar(tuberia.crear_tuberia(range(1, 11)), lambda numeros: numeros % 2 == 0),
+    lambda numeros: numeros**2)
+print(tuberia.sumar_numpy(cuadrados_pares_numpy))
@@ -20,23 +20,21 @@
       "Lista original: [1, 2, 3, 4, 5, 6, 3, 7, 8, 9, 8, 10]\n",
       "Elementos unicos: [1, 2, 4, 5, 6, 7, 9, 10]\n",
       "Elementos duplicados: [3, 8]\n",
-      "Lista nueva: [1, 2, 4, 5, 6, 3, 7, 9, 8, 10]\n"
+      "Lista nueva: [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]\n"
      ]
     }
    ],
    "source": [
+    "from duplicados import buscar_duplicados, sin_repetidos\n",
+    "\n",
     "lista = [1,2,3,4,5,6,3,7,8,9,8,10]\n",
     "print(\"Lista original:\",lista)\n",
-    "elementos_duplicados = []\n",
-    "elementos_unicos = []\n",
-    "for elemento in lista:\n",
-    "    if lista.count(elemento) > 1:\n",
-    "        if elemento not in elementos_duplicados:\n",
-    "            elementos_duplicados.append(elemento)\n",
-    "    else:\n",
-    "        elementos_unicos.append(elemento)\n",
-    "for elemento in elementos_duplicados:\n",
-    "    lista.remove(elemento)\n",
+    "# contamos las apariciones de todos los elementos en una sola pasada\n",
+    "# (lista.count dentro del bucle recorre la lista entera por cada elemento)\n",
+    "elementos_duplicados, elementos_unicos = buscar_duplicados(lista)\n",
+    "# dict.fromkeys se queda con la primera aparicion de cada elemento\n",
+    "# (sin llamar a lista.remove, que recorre y desplaza la lista cada vez)\n",
+    "lista = sin_repetidos(lista)\n",
     "\n",
     "print(\"Elementos unicos:\", elementos_unicos)\n",
     "print(\"Elementos duplicados:\", elementos_duplicados)\n",
@@ -0,0 +1,100 @@
+# Deteccion de elementos duplicados en una sola pasada
+# - buscar_duplicados y sin_repetidos usan Counter y dict.fromkeys (O(n))
+#   en vez de lista.count y lista.remove dentro de un bucle (O(n²))
+# - duplicados_numpy hace lo mismo para arrays numericos con np.unique
+# - para flujos enormes que no caben en memoria, deduplicar_flujo usa un
+#   filtro de Bloom: memoria fija a cambio de descartar por error una
+#   pequeña proporcion de elementos nuevos (falsos positivos)
+
+import hashlib
+import math
+from collections import Counter
+
+import numpy as np
+
+
+def buscar_duplicados(lista):
+    """ Devuelve (duplicados, unicos): los elementos que aparecen mas de
+    una vez y los que aparecen una sola vez, en orden de primera aparicion """
+    # INPUT:
+    # - lista: lista (o iterable) de elementos hashables
+
+    apariciones = Counter(lista)
+    # Counter conserva el orden en el que aparece cada elemento por primera vez
+    duplicados = [elemento for elemento, veces in apariciones.items() if veces > 1]
+    unicos = [elemento for elemento, veces in apariciones.items() if veces == 1]
+
+    return duplicados, unicos
+
+
+def sin_repetidos(lista):
+    """ Devuelve los elementos sin repetir, en orden de primera aparicion """
+
+    return list(dict.fromkeys(lista))
+
+
+def duplicados_numpy(array):
+    """ Devuelve (valores_duplicados, veces) de un array numerico,
+    con los valores ordenados de menor a mayor """
+
+    valores, veces = np.unique(np.asarray(array), return_counts = True)
+    repetidos = veces > 1
+    return valores[repetidos], veces[repetidos]
+
+
+def crear_filtro_bloom(elementos_esperados, probabilidad_error = 0.01):
+    """ Crea un filtro de Bloom para elementos_esperados elementos con
+    la probabilidad de falso positivo indicada """
+    # INPUT:
+    # - elementos_esperados: int
+    # - probabilidad_error: float entre 0 y 1
+
+    # tamaño optimo en bits y numero de funciones hash
+    bits = max(8, int(-elementos_esperados * math.log(probabilidad_error) / math.log(2) ** 2))
+    funciones = max(1, round(bits / elementos_esperados * math.log(2)))
+
+    filtro = {
+        "bits": bytearray((bits + 7) // 8),
+        "numero_bits": bits,
+        "funciones": funciones
+    }
+
+    return filtro
+
+
+def _posiciones(filtro, elemento):
+    """ Posiciones de bit del elemento (doble hash: h1 + i * h2) """
+
+    resumen = hashlib.blake2b(repr(elemento).encode("utf-8"), digest_size = 16).digest()
+    h1 = int.from_bytes(resumen[:8], "little")
+    h2 = int.from_bytes(resumen[8:], "little") | 1
+    return [(h1 + i * h2) % filtro["numero_bits"] for i in range(filtro["funciones"])]
+
+
+def anadir_si_nuevo(filtro, elemento):
+    """ Añade el elemento al filtro. Devuelve True si no estaba
+    (seguro) y False si probablemente ya estaba """
+
+    nuevo = False
+    for posicion in _posiciones(filtro, elemento):
+        byte, bit = divmod(posicion, 8)
+        if not filtro["bits"][byte] & (1 << bit):
+            filtro["bits"][byte] |= 1 << bit
+            nuevo = True
+
+    return nuevo
+
+
+def deduplicar_flujo(flujo, elementos_esperados, probabilidad_error = 0.01):
+    """ Devuelve (generador) los elementos del flujo que no habian
+    aparecido antes, con memoria fija. Aproximado: una proporcion
+    probabilidad_error de elementos nuevos se puede descartar por error """
+    # INPUT:
+    # - flujo: iterable de elementos
+    # - elementos_esperados: int, numero aproximado de elementos distintos
+    # - probabilidad_error: float
+
+    filtro = crear_filtro_bloom(elementos_esperados, probabilidad_error)
+    for elemento in flujo:
+        if anadir_si_nuevo(filtro, elemento):
+            yield elemento
@@ -0,0 +1,188 @@
+# Tuberias perezosas de filtrar / transformar / reducir
+# Una tuberia es un diccionario con el origen de los datos y la lista de
+# etapas que se aplicaran a cada elemento:
+# {
+#   "origen": iterable (lista, range, generador, fichero...). Si es un
+#             generador o un fichero la tuberia solo se puede ejecutar una vez,
+#   "etapas": [("filtrar", funcion), ("transformar", funcion), ...]
+# }
+# Añadir etapas no calcula nada. Al ejecutar, las etapas seguidas del mismo
+# tipo se fusionan en una sola funcion y cada elemento pasa por todas las
+# etapas antes de leer el siguiente, asi no se crean listas intermedias y
+# la memoria no depende del numero de elementos.
+# ejecutar_numpy y sumar_numpy trabajan con int64: si un resultado no cabe
+# lanzan OverflowError; con exacto = True usan enteros de Python.
+
+from functools import reduce
+
+import numpy as np
+
+
+def crear_tuberia(origen):
+    """ Crea una tuberia sin etapas sobre el origen de datos """
+
+    return {"origen": origen, "etapas": []}
+
+
+def filtrar(tuberia, condicion):
+    """ Devuelve una tuberia nueva que solo deja pasar los elementos
+    para los que condicion(elemento) es verdadero """
+
+    return {"origen": tuberia["origen"], "etapas": tuberia["etapas"] + [("filtrar", condicion)]}
+
+
+def transformar(tuberia, funcion):
+    """ Devuelve una tuberia nueva que aplica funcion a cada elemento """
+
+    return {"origen": tuberia["origen"], "etapas": tuberia["etapas"] + [("transformar", funcion)]}
+
+
+def _componer(f, g):
+    """ Funcion que aplica f y despues g """
+    return lambda x: g(f(x))
+
+
+def _ambas(f, g):
+    """ Condicion que se cumple si se cumplen f y g """
+    return lambda x: f(x) and g(x)
+
+
+def _ambas_numpy(f, g):
+    """ Mascara de los elementos que cumplen f y g (version NumPy) """
+    return lambda x: f(x) & g(x)
+
+
+def _fusionar(etapas, unir_condiciones = _ambas):
+    """ Une las etapas seguidas del mismo tipo en una sola etapa """
+
+    fusionadas = []
+    for tipo, funcion in etapas:
+        if fusionadas and fusionadas[-1][0] == tipo:
+            anterior = fusionadas[-1][1]
+            if tipo == "transformar":
+                fusionadas[-1] = (tipo, _componer(anterior, funcion))
+            else:
+                fusionadas[-1] = (tipo, unir_condiciones(anterior, funcion))
+        else:
+            fusionadas.append((tipo, funcion))
+
+    return fusionadas
+
+
+def ejecutar(tuberia):
+    """ Devuelve (generador) los elementos que salen de la tuberia """
+
+    etapas = _fusionar(tuberia["etapas"])
+
+    for elemento in tuberia["origen"]:
+        pasa = True
+        for tipo, funcion in etapas:
+            if tipo == "transformar":
+                elemento = funcion(elemento)
+            elif not funcion(elemento):
+                pasa = False
+                break
+        if pasa:
+            yield elemento
+
+
+def reducir(tuberia, funcion, inicial):
+    """ Combina los elementos de la tuberia con funcion(acumulado, elemento) """
+
+    return reduce(funcion, ejecutar(tuberia), inicial)
+
+
+def sumar(tuberia):
+    """ Suma los elementos que salen de la tuberia """
+
+    return sum(ejecutar(tuberia))
+
+
+def _transformar_bloque(funcion, bloque):
+    """ Aplica funcion a un bloque int64 y comprueba que el resultado
+    cabe en int64. Lanza OverflowError si no cabe """
+
+    resultado = funcion(bloque)
+    if not np.issubdtype(np.asarray(resultado).dtype, np.integer):
+        return resultado
+
+    # repetimos la cuenta con float solo como pista: los resultados
+    # pequeños seguro que caben, los cercanos a 2**63 se repiten con
+    # enteros exactos de Python
+    try:
+        with np.errstate(all = "ignore"):
+            aproximado = funcion(bloque.astype(np.float64))
+        dudosos = ~(np.abs(aproximado) < 2.0 ** 62)
+    except TypeError:
+        # las operaciones de bits (>>, &...) no existen con float
+        dudosos = np.ones(len(bloque), dtype = bool)
+
+    if np.any(dudosos):
+        exactos = funcion(bloque[dudosos].astype(object)).tolist()
+        limites = np.iinfo(np.int64)
+        if any(not limites.min <= int(valor) <= limites.max for valor in exactos):
+            raise OverflowError("El resultado de una etapa no cabe en int64, usa exacto = True")
+        resultado[dudosos] = exactos
+
+    return resultado
+
+
+def ejecutar_numpy(tuberia, tamano_bloque = 1000000, exacto = False, comprobar = True):
+    """ Devuelve (generador) los elementos que salen de la tuberia por
+    bloques de arrays de NumPy. El origen debe ser un range y las funciones
+    de las etapas deben trabajar con arrays (las condiciones devuelven una
+    mascara de booleanos, por ejemplo lambda x: x % 2 == 0) """
+    # INPUT:
+    # - tuberia: dict creado con crear_tuberia sobre un range
+    # - tamano_bloque: int, numeros que se generan de una vez
+    # - exacto: bool. Con False los bloques son int64 y si el resultado
+    #   de una etapa no cabe se lanza OverflowError. Con True los bloques
+    #   son enteros de Python: sin limite pero mas lento
+    # - comprobar: bool, con False no se comprueba el desbordamiento (mas
+    #   rapido, para tuberias que se sabe que caben en int64)
+    #
+    # Las etapas seguidas del mismo tipo se fusionan y se comprueba el
+    # resultado de cada grupo. Con sumas, restas y productos un valor
+    # intermedio que no cabe no importa si el resultado final cabe (int64
+    # da la vuelta de forma exacta), pero con // o % despues de un valor
+    # intermedio que no cabe el error no se detecta: usa exacto = True
+
+    origen = tuberia["origen"]
+    tipo_datos = object if exacto else np.int64
+    etapas = _fusionar(tuberia["etapas"], _ambas_numpy)
+
+    for inicio in range(0, len(origen), tamano_bloque):
+        # generamos solo el trozo del range que toca
+        trozo = origen[inicio:inicio + tamano_bloque]
+        bloque = np.arange(trozo.start, trozo.stop, trozo.step, dtype = tipo_datos)
+
+        for tipo, funcion in etapas:
+            if tipo == "transformar":
+                if exacto or not comprobar:
+                    bloque = funcion(bloque)
+                else:
+                    bloque = _transformar_bloque(funcion, bloque)
+            else:
+                bloque = bloque[funcion(bloque)]
+        yield bloque
+
+
+def sumar_numpy(tuberia, tamano_bloque = 1000000, exacto = False, comprobar = True):
+    """ Suma los elementos de la tuberia con el motor de NumPy.
+    Con enteros el total es un entero de Python, asi que no desborda """
+
+    total = 0
+    for bloque in ejecutar_numpy(tuberia, tamano_bloque, exacto, comprobar):
+        if len(bloque) == 0:
+            continue
+        if exacto or not np.issubdtype(bloque.dtype, np.integer):
+            # enteros de Python o float: la suma del bloque no desborda
+            suma = bloque.sum()
+            total += suma.item() if isinstance(suma, np.generic) else suma
+        elif float(np.abs(bloque.astype(np.float64)).max()) * len(bloque) < 2.0 ** 63:
+            total += int(bloque.sum())
+        else:
+            # la suma del bloque podria no caber en int64: enteros de Python
+            total += sum(bloque.tolist())
+
+    return total
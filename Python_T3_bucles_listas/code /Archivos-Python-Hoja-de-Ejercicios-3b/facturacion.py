@@ -0,0 +1,65 @@
+# Calculo de la facturacion de un catalogo de productos
+# precios y unidades son listas o arrays con un elemento por producto.
+# Para catalogos muy grandes los arrays pueden estar guardados con np.save
+# y cargarse proyectados en memoria (cargar_array); las funciones con
+# tamano_bloque los recorren por bloques sin cargarlos enteros.
+
+import numpy as np
+
+
+def cargar_array(ruta):
+    """ Carga un array guardado con np.save proyectandolo en memoria """
+
+    return np.load(ruta, mmap_mode = "r")
+
+
+def facturacion_por_producto(precios, unidades):
+    """ Devuelve el dinero facturado por cada producto (precio * unidades) """
+
+    return np.asarray(precios, dtype = float) * np.asarray(unidades)
+
+
+def facturacion_total(precios, unidades, tamano_bloque = None):
+    """ Devuelve el dinero total facturado (producto escalar de precios
+    y unidades). Con tamano_bloque se calcula por bloques """
+    # INPUT:
+    # - precios, unidades: listas o arrays (tambien proyectados en memoria)
+    # - tamano_bloque: int o None para calcularlo de una vez
+
+    precios = np.asarray(precios, dtype = float)
+    unidades = np.asarray(unidades)
+
+    if tamano_bloque is None:
+        return float(np.dot(precios, unidades))
+
+    total = 0.0
+    for inicio in range(0, len(precios), tamano_bloque):
+        fin = inicio + tamano_bloque
+        total += float(np.dot(precios[inicio:fin], unidades[inicio:fin]))
+    return total
+
+
+def facturacion_por_categoria(precios, unidades, categorias, tamano_bloque = None):
+    """ Devuelve (categorias_unicas, facturacion) con el dinero facturado
+    por cada categoria de producto """
+    # INPUT:
+    # - precios, unidades: listas o arrays
+    # - categorias: lista o array con la categoria de cada producto
+    # - tamano_bloque: int o None para calcularlo de una vez
+
+    precios = np.asarray(precios, dtype = float)
+    unidades = np.asarray(unidades)
+    categorias_unicas, grupos = np.unique(np.asarray(categorias), return_inverse = True)
+    grupos = grupos.ravel()
+
+    if tamano_bloque is None:
+        tamano_bloque = max(len(precios), 1)
+
+    facturacion = np.zeros(len(categorias_unicas))
+    for inicio in range(0, len(precios), tamano_bloque):
+        fin = inicio + tamano_bloque
+        # bincount suma el dinero de los productos de cada categoria
+        facturacion += np.bincount(grupos[inicio:fin], weights = precios[inicio:fin] * unidades[inicio:fin],
+                                   minlength = len(categorias_unicas))
+
+    return categorias_unicas, facturacion
@@ -23,13 +23,17 @@ la nota media de toda la clase.
 ### SOLUCION USANDO UN BUCLES PARA 
 ### LA MEDIA INDIVIDUAL Y LA DE LA CLASE
 ### PERO SIN USAR LA FUNCION SUM
+### (las sumas las mantiene el cuaderno de notas)
 
 
+import cuaderno_notas
+
 # --- lista con los nombres de los alumnos
 estudiantes = ["Juan", "María", "Pedro"]
 
 # --- Creamos nuestra base de datos con las notas
-database = []
+# (array estudiantes x evaluaciones: deberes, examenes, proyectos)
+database = cuaderno_notas.crear_cuaderno(cuaderno_notas.EVALUACIONES)
 
 # --- Pido los datos de las notas para cada estudiante
 for estudiante in estudiantes:
@@ -50,7 +54,8 @@ for estudiante in estudiantes:
     notas.append(proyectos)
     
     # añadir a la database el nombre y la lista de notas del alumno
-    database.append([estudiante, notas])
+    # (el cuaderno actualiza las sumas del alumno y de la clase)
+    cuaderno_notas.agregar_estudiante(database, estudiante, notas)
 
 
 '''
@@ -67,26 +72,14 @@ print("  ")
 print("  ")
 
 # --- Calcular la nota media de cada estudiante
-sum_media = 0
-for data in database:
-    # extraemos el nombre del estudiante
-    nombre = data[0]
-    # extraemos la lista de notas del estudiante
-    notas = data[1]
-    # calculamos la suma de las notas del estudiante
-    suma_notas = 0
-    for nota in notas:
-        suma_notas = suma_notas + nota
-    # calculamos la media del estudiante
-    media = suma_notas / len(notas)
+for nombre in database["estudiantes"]:
+    # la media se calcula con la suma y el numero de notas guardados
+    media = cuaderno_notas.media_estudiante(database, nombre)
     # imprimimos por pantalla la media de cada estudiante
     print(f"La media de {nombre} es {media :.2f}")
-    # calculamos la suma de todas las medias
-    sum_media = sum_media + media
 
-# divividmos la suma de todas las medias por el numero de alumnos
-# para obtener la media de toda la clase
-media_clase = sum_media / len(database)
+# la media de la clase tambien se lee de las sumas de la clase
+media_clase = cuaderno_notas.media_clase(database)
 # imprimimos por pantalla la media de la clase
 print("La media de la clase es {:.2f}".format(media_clase))
-
+print("La varianza de las notas de la clase es {:.2f}".format(cuaderno_notas.varianza_clase(database)))
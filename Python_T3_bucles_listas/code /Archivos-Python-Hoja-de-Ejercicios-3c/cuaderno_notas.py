@@ -0,0 +1,201 @@
+# Cuaderno de notas de una clase
+# Las notas se guardan en un array 2D (estudiantes x evaluaciones), con nan
+# en las notas que faltan. Ademas se mantienen las sumas, las sumas de los
+# cuadrados y el numero de notas de cada estudiante y de toda la clase, asi
+# las medias y varianzas se leen sin recorrer las notas.
+# Estructura del cuaderno:
+# {
+#   "evaluaciones": ["deberes", "examenes", "proyectos"],
+#   "estudiantes": ["Juan", ...],
+#   "filas": {"Juan": 0, ...},
+#   "notas": array (capacidad x evaluaciones),
+#   "suma": array por estudiante, "suma_cuadrados": array, "cuenta": array,
+#   "clase": {"suma": ..., "suma_cuadrados": ..., "cuenta": ...}
+# }
+
+import csv
+
+import numpy as np
+
+EVALUACIONES = ["deberes", "examenes", "proyectos"]
+
+
+def crear_cuaderno(evaluaciones = EVALUACIONES, capacidad = 1024):
+    """ Crea un cuaderno vacio con sitio para capacidad estudiantes
+    (crece solo si hace falta) """
+    # INPUT:
+    # - evaluaciones: lista de str
+    # - capacidad: int
+
+    cuaderno = {
+        "evaluaciones": list(evaluaciones),
+        "estudiantes": [],
+        "filas": {},
+        "notas": np.full((capacidad, len(evaluaciones)), np.nan),
+        "suma": np.zeros(capacidad),
+        "suma_cuadrados": np.zeros(capacidad),
+        "cuenta": np.zeros(capacidad, dtype = np.int64),
+        "clase": {"suma": 0.0, "suma_cuadrados": 0.0, "cuenta": 0}
+    }
+
+    return cuaderno
+
+
+def _asegurar_capacidad(cuaderno, estudiantes_nuevos):
+    """ Duplica el tamaño de los arrays hasta que quepan los estudiantes nuevos """
+
+    necesarios = len(cuaderno["estudiantes"]) + estudiantes_nuevos
+    capacidad = len(cuaderno["notas"])
+    if necesarios <= capacidad:
+        return
+
+    while capacidad < necesarios:
+        capacidad = capacidad * 2
+
+    extra = capacidad - len(cuaderno["notas"])
+    cuaderno["notas"] = np.vstack([cuaderno["notas"], np.full((extra, len(cuaderno["evaluaciones"])), np.nan)])
+    for clave in ["suma", "suma_cuadrados", "cuenta"]:
+        cuaderno[clave] = np.concatenate([cuaderno[clave], np.zeros(extra, dtype = cuaderno[clave].dtype)])
+
+
+def agregar_estudiantes(cuaderno, nombres, notas):
+    """ Añade de una vez varios estudiantes con sus notas """
+    # INPUT:
+    # - cuaderno: dict creado con crear_cuaderno
+    # - nombres: lista de str (que no esten ya en el cuaderno)
+    # - notas: array o lista de listas (estudiantes x evaluaciones), nan si falta
+
+    notas = np.asarray(notas, dtype = float).reshape(len(nombres), len(cuaderno["evaluaciones"]))
+    _asegurar_capacidad(cuaderno, len(nombres))
+
+    inicio = len(cuaderno["estudiantes"])
+    fin = inicio + len(nombres)
+    for i, nombre in enumerate(nombres):
+        cuaderno["filas"][nombre] = inicio + i
+    cuaderno["estudiantes"].extend(nombres)
+
+    # sumas de cada estudiante (nansum ignora las notas que faltan)
+    cuaderno["notas"][inicio:fin] = notas
+    cuaderno["suma"][inicio:fin] = np.nansum(notas, axis = 1)
+    cuaderno["suma_cuadrados"][inicio:fin] = np.nansum(notas ** 2, axis = 1)
+    cuaderno["cuenta"][inicio:fin] = np.count_nonzero(~np.isnan(notas), axis = 1)
+
+    clase = cuaderno["clase"]
+    clase["suma"] += cuaderno["suma"][inicio:fin].sum()
+    clase["suma_cuadrados"] += cuaderno["suma_cuadrados"][inicio:fin].sum()
+    clase["cuenta"] += int(cuaderno["cuenta"][inicio:fin].sum())
+
+
+def agregar_estudiante(cuaderno, nombre, notas):
+    """ Añade un estudiante con sus notas (lista, una por evaluacion) """
+
+    agregar_estudiantes(cuaderno, [nombre], [notas])
+
+
+def poner_nota(cuaderno, nombre, evaluacion, nota):
+    """ Pone o corrige una nota actualizando las sumas con la diferencia.
+    Con nota nan se quita la nota (nan es "nota que falta") """
+    # INPUT:
+    # - cuaderno: dict creado con crear_cuaderno
+    # - nombre: str, estudiante existente
+    # - evaluacion: str, una de cuaderno["evaluaciones"]
+    # - nota: float, o nan para quitarla
+
+    fila = cuaderno["filas"][nombre]
+    columna = cuaderno["evaluaciones"].index(evaluacion)
+    anterior = cuaderno["notas"][fila, columna]
+    clase = cuaderno["clase"]
+
+    # quitamos la nota anterior de las sumas (si la habia)
+    if not np.isnan(anterior):
+        cuaderno["suma"][fila] -= anterior
+        cuaderno["suma_cuadrados"][fila] -= anterior ** 2
+        cuaderno["cuenta"][fila] -= 1
+        clase["suma"] -= anterior
+        clase["suma_cuadrados"] -= anterior ** 2
+        clase["cuenta"] -= 1
+
+    cuaderno["notas"][fila, columna] = nota
+    # una nota que falta no suma ni cuenta
+    if np.isnan(nota):
+        return
+
+    cuaderno["suma"][fila] += nota
+    cuaderno["suma_cuadrados"][fila] += nota ** 2
+    cuaderno["cuenta"][fila] += 1
+    clase["suma"] += nota
+    clase["suma_cuadrados"] += nota ** 2
+    clase["cuenta"] += 1
+
+
+def _media_varianza(suma, suma_cuadrados, cuenta):
+    """ Media y varianza a partir de la suma, la suma de cuadrados y la cuenta """
+
+    if cuenta == 0:
+        return np.nan, np.nan
+    media = suma / cuenta
+    # max evita varianzas negativas muy pequeñas por redondeo
+    return media, max(suma_cuadrados / cuenta - media ** 2, 0.0)
+
+
+def media_estudiante(cuaderno, nombre):
+    """ Devuelve la nota media del estudiante """
+
+    fila = cuaderno["filas"][nombre]
+    return _media_varianza(cuaderno["suma"][fila], cuaderno["suma_cuadrados"][fila], cuaderno["cuenta"][fila])[0]
+
+
+def varianza_estudiante(cuaderno, nombre):
+    """ Devuelve la varianza de las notas del estudiante """
+
+    fila = cuaderno["filas"][nombre]
+    return _media_varianza(cuaderno["suma"][fila], cuaderno["suma_cuadrados"][fila], cuaderno["cuenta"][fila])[1]
+
+
+def media_clase(cuaderno):
+    """ Devuelve la nota media de todas las notas de la clase """
+
+    clase = cuaderno["clase"]
+    return _media_varianza(clase["suma"], clase["suma_cuadrados"], clase["cuenta"])[0]
+
+
+def varianza_clase(cuaderno):
+    """ Devuelve la varianza de todas las notas de la clase """
+
+    clase = cuaderno["clase"]
+    return _media_varianza(clase["suma"], clase["suma_cuadrados"], clase["cuenta"])[1]
+
+
+def importar_csv(ruta, capacidad = 1024):
+    """ Crea un cuaderno a partir de un CSV con cabecera
+    "nombre,evaluacion1,evaluacion2,..." (celda vacia si falta la nota) """
+    # INPUT:
+    # - ruta: str
+    # - capacidad: int, capacidad inicial del cuaderno
+
+    with open(ruta, newline = "", encoding = "utf-8") as fichero:
+        lector = csv.reader(fichero)
+        cabecera = next(lector)
+        nombres = []
+        filas = []
+        for fila in lector:
+            nombres.append(fila[0])
+            filas.append([float(nota) if nota else np.nan for nota in fila[1:]])
+
+    cuaderno = crear_cuaderno(cabecera[1:], max(capacidad, len(nombres)))
+    agregar_estudiantes(cuaderno, nombres, np.array(filas).reshape(len(nombres), len(cabecera) - 1))
+
+    return cuaderno
+
+
+def exportar_csv(cuaderno, ruta):
+    """ Guarda el cuaderno en un CSV con el formato de importar_csv """
+    # INPUT:
+    # - cuaderno: dict creado con crear_cuaderno
+    # - ruta: str
+
+    with open(ruta, "w", newline = "", encoding = "utf-8") as fichero:
+        escritor = csv.writer(fichero)
+        escritor.writerow(["nombre"] + cuaderno["evaluaciones"])
+        for fila, nombre in enumerate(cuaderno["estudiantes"]):
+            escritor.writerow([nombre] + ["" if np.isnan(nota) else repr(float(nota)) for nota in cuaderno["notas"][fila]])
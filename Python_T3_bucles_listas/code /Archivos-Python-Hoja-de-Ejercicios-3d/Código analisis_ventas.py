@@ -4,26 +4,23 @@ en línea y tienes una lista de ventas de los últimos
 semana para identificar los días de mayor venta.
 '''
 
+import agrupacion_temporal
+
 # lista con las ventas del mes
 ventas = [120, 80, 140, 200, 75, 100, 180, 220, 160, 110, 90, 120, 170, 190, 250, 300, 95, 110, 140, 180, 200, 160, 120, 80, 170, 150, 210, 190, 230, 250]
-# lista con los dias de la semana
-dias_semana = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"]
-# lista donde guardar las ventas por dia
-ventas_totales = [0, 0, 0, 0, 0, 0, 0] 
+# fecha del primer dia de la lista (un lunes)
+fecha_inicio = "2024-01-01"
 
-# recorrer la lista de ventas con un bucle
-dia_venta = 0
-for venta in ventas:
-    ## sumar para cada dia de la semana las ventas realizadas
-    ventas_totales[dia_venta] = ventas_totales[dia_venta] + venta
-    ## pasamos al dia siguiete
-    dia_venta = dia_venta + 1
-    ## si llegamos al domingo volvemos de nuevo al lunes
-    if dia_venta == 7:
-        # cambiamos el valor al indice del lunes
-        dia_venta = 0
+# sumar para cada dia de la semana las ventas realizadas,
+# calculando el dia de la semana real de cada fecha
+dias_semana, ventas_totales = agrupacion_temporal.agrupar_ventas(ventas, fecha_inicio, "dia_semana")
 
 ## imprimir las ventas realizadas para cada dia de la semana
 ## a lo a largo de ese mes
 for i in range(len(dias_semana)):
-    print(dias_semana[i]+ ":", ventas_totales[i])
\ No newline at end of file
+    print(dias_semana[i]+ ":", int(ventas_totales[i]))
+
+## tambien podemos agrupar por semanas ISO
+semanas, ventas_semanas = agrupacion_temporal.agrupar_ventas(ventas, fecha_inicio, "semana")
+for i in range(len(semanas)):
+    print("Semana", semanas[i] + ":", int(ventas_semanas[i]))
@@ -7,32 +7,33 @@ correctos y permita el acceso solo si ambos son correctos.
 
 '''
 
+import autenticacion
+
 # lista de nombres de usuario
 nombres_usuario = ["juan123", "ana456", "pedro789"]
 # lista de contraseña
 passwords = ["clave123", "clave456", "clave789"]
 
+# almacen de credenciales: diccionario usuario --> (sal, hash de la contraseña)
+almacen = autenticacion.crear_almacen()
+# recorrer lista de usuarios y contraseñas para registrarlos
+for i in range(len(nombres_usuario)):
+    autenticacion.registrar_usuario(almacen, nombres_usuario[i], passwords[i])
+
 # pedir al usuario su nombre de usuario
 usuario = input("Ingrese su nombre de usuario: ")
 # pedir al usuario la contraseña
 password = input("Ingrese su contaseña: ")
 
-
-credenciales = False # boolenano que sera true si el usuario
-                     # y contraseña coinciden con algunos de 
-                     # nuestra lista
-
-# recorrer lista de usuarios y contraseñas
-for i in range(len(nombres_usuario)):
-    ## comprobar si son iguales a los introducidos por el user
-    if nombres_usuario[i] == usuario and passwords[i] == password:
-        # como son un nombre y contraseñas validos 
-        # credenciales pasa a ser true
-        credenciales = True
+# buscamos el usuario en el diccionario y comparamos el hash de la contraseña
+resultado = autenticacion.verificar(almacen, usuario, password)
 
 ### si el usuario y contaseña son validos damos la bienvenida
-if credenciales == True:
+if resultado == autenticacion.ACCESO_PERMITIDO:
     print("Accceso permitido")
+### si hay demasiados intentos fallidos bloqueamos al usuario
+elif resultado == autenticacion.DEMASIADOS_INTENTOS:
+    print("Demasiados intentos. Vuelva a intentarlo mas tarde")
 ### si no son validos denegamos acceso
 else:
     print("Nombre de usuario o contraseña incorrectos")
@@ -0,0 +1,81 @@
+# Agrupacion de series de ventas diarias por dia de la semana, semana o mes
+# Las ventas pueden ser una lista/array de una tienda (n_dias) o un array
+# 2D con una fila por tienda (n_tiendas x n_dias). El primer dato de cada
+# fila corresponde a fecha_inicio y los siguientes a los dias consecutivos,
+# usando fechas reales de calendario (datetime64).
+
+from datetime import date
+
+import numpy as np
+
+DIAS_SEMANA = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"]
+
+
+def fechas_diarias(fecha_inicio, numero_dias):
+    """ Devuelve un array datetime64[D] con numero_dias fechas seguidas """
+    # INPUT:
+    # - fecha_inicio: str "AAAA-MM-DD"
+    # - numero_dias: int
+
+    return np.datetime64(fecha_inicio, "D") + np.arange(numero_dias)
+
+
+def dia_semana(fechas):
+    """ Devuelve el dia de la semana de cada fecha (0 = lunes, 6 = domingo) """
+
+    # el dia 0 de datetime64 (1970-01-01) fue jueves
+    return (fechas.astype("datetime64[D]").astype(np.int64) + 3) % 7
+
+
+def _sumar_por_grupo(ventas, grupos, numero_grupos):
+    """ Suma las columnas de ventas que tienen el mismo grupo """
+
+    if ventas.ndim == 1:
+        return np.bincount(grupos, weights = ventas, minlength = numero_grupos)
+
+    # con varias tiendas multiplicamos por una matriz (n_dias x n_grupos)
+    # con un 1 en el grupo de cada dia: todas las tiendas en una operacion
+    pertenencia = np.zeros((len(grupos), numero_grupos))
+    pertenencia[np.arange(len(grupos)), grupos] = 1
+    return ventas @ pertenencia
+
+
+def agrupar_ventas(ventas, fecha_inicio, periodo = "dia_semana"):
+    """ Suma las ventas diarias por periodo y devuelve (etiquetas, totales)
+    - "dia_semana": etiquetas Lunes..Domingo
+    - "semana": semanas ISO, etiquetas "AAAA-Wss"
+    - "mes": etiquetas "AAAA-MM"
+    totales tiene una columna por etiqueta (y una fila por tienda si
+    ventas es 2D) """
+    # INPUT:
+    # - ventas: lista o array (n_dias) o array 2D (n_tiendas x n_dias)
+    # - fecha_inicio: str "AAAA-MM-DD", fecha del primer dato
+    # - periodo: "dia_semana", "semana" o "mes"
+
+    ventas = np.asarray(ventas, dtype = float)
+    fechas = fechas_diarias(fecha_inicio, ventas.shape[-1])
+
+    if periodo == "dia_semana":
+        return DIAS_SEMANA, _sumar_por_grupo(ventas, dia_semana(fechas), 7)
+
+    if periodo == "semana":
+        # cada dia se agrupa con el lunes de su semana
+        inicios = fechas - dia_semana(fechas)
+    elif periodo == "mes":
+        inicios = fechas.astype("datetime64[M]")
+    else:
+        raise ValueError(f"Periodo no valido: {periodo}")
+
+    # numeramos los periodos distintos y el periodo de cada dia
+    unicos, grupos = np.unique(inicios, return_inverse = True)
+    totales = _sumar_por_grupo(ventas, grupos.ravel(), len(unicos))
+
+    if periodo == "semana":
+        etiquetas = []
+        for lunes in unicos:
+            anio, semana, _ = date.fromisoformat(str(lunes)).isocalendar()
+            etiquetas.append(f"{anio}-W{semana:02d}")
+    else:
+        etiquetas = [str(mes) for mes in unicos]
+
+    return etiquetas, totales
@@ -0,0 +1,170 @@
+# Modulo de autenticacion de usuarios
+# Las contraseñas no se guardan: se guarda una sal aleatoria y el hash
+# PBKDF2 de la contraseña con esa sal. Estructura del almacen:
+# {
+#   "usuarios": {"usuario": (sal, hash), ...},
+#   "iteraciones": iteraciones de PBKDF2,
+#   "limitador": {"usuario": [fichas, instante de la ultima recarga]},
+#                (solo usuarios con intentos fallidos recientes),
+#   "tamano_limitador": usuarios a partir de los cuales se olvidan los que
+#                       ya han recuperado fichas (los bloqueados nunca),
+#   "capacidad": maximo de intentos fallidos seguidos por usuario,
+#   "recarga": intentos que se recuperan por segundo,
+#   "cache": {"usuario": resumen rapido del ultimo acceso correcto},
+#   "clave_cache": clave aleatoria para los resumenes de la cache,
+#   "tamano_cache": numero maximo de usuarios en la cache
+# }
+
+import hashlib
+import hmac
+import os
+import time
+
+ACCESO_PERMITIDO = "permitido"
+ACCESO_DENEGADO = "denegado"
+DEMASIADOS_INTENTOS = "bloqueado"
+
+# iteraciones recomendadas por OWASP para PBKDF2-HMAC-SHA256
+ITERACIONES = 600000
+
+# entradas del limitador que se revisan como mucho en cada intento fallido
+REVISIONES_LIMITADOR = 10
+
+
+def derivar_hash(password, sal, iteraciones = ITERACIONES):
+    """ Calcula el hash PBKDF2-HMAC-SHA256 de la contraseña con la sal """
+    # INPUT:
+    # - password: str
+    # - sal: bytes
+    # - iteraciones: int
+
+    return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), sal, iteraciones)
+
+
+def crear_almacen(iteraciones = ITERACIONES, capacidad = 5, recarga = 1 / 60, tamano_cache = 10000,
+                  tamano_limitador = 100000):
+    """ Crea un almacen de credenciales vacio """
+    # INPUT:
+    # - iteraciones: int, iteraciones de PBKDF2
+    # - capacidad: int, intentos fallidos seguidos permitidos a cada usuario
+    # - recarga: float, intentos que recupera cada usuario por segundo
+    # - tamano_cache: int, usuarios que se recuerdan en la cache
+    # - tamano_limitador: int, usuarios que se recuerdan en el limitador
+
+    almacen = {
+        "usuarios": {},
+        "iteraciones": iteraciones,
+        "limitador": {},
+        "tamano_limitador": tamano_limitador,
+        "capacidad": capacidad,
+        "recarga": recarga,
+        "cache": {},
+        "clave_cache": os.urandom(32),
+        "tamano_cache": tamano_cache
+    }
+
+    return almacen
+
+
+def registrar_usuario(almacen, usuario, password):
+    """ Registra un usuario nuevo o cambia su contraseña """
+    # INPUT:
+    # - almacen: dict creado con crear_almacen
+    # - usuario: str
+    # - password: str
+
+    sal = os.urandom(16)
+    almacen["usuarios"][usuario] = (sal, derivar_hash(password, sal, almacen["iteraciones"]))
+    # la contraseña ha cambiado, olvidamos el acceso guardado en la cache
+    almacen["cache"].pop(usuario, None)
+
+
+def _fichas(almacen, usuario, ahora):
+    """ Cubo de fichas por usuario: devuelve las fichas que le quedan,
+    recargadas con el tiempo transcurrido sin pasar de la capacidad """
+
+    entrada = almacen["limitador"].get(usuario)
+    if entrada is None:
+        return almacen["capacidad"]
+
+    fichas = min(almacen["capacidad"], entrada[0] + (ahora - entrada[1]) * almacen["recarga"])
+    if fichas >= almacen["capacidad"]:
+        # un cubo lleno es igual que no tener cubo, asi no ocupa memoria
+        del almacen["limitador"][usuario]
+    return fichas
+
+
+def _gastar_ficha(almacen, usuario, ahora):
+    """ Gasta una ficha del usuario tras un intento fallido """
+
+    fichas = _fichas(almacen, usuario, ahora)
+    # lo movemos al final: el limitador queda ordenado del usuario que
+    # lleva mas tiempo sin fallar al que fallo por ultimo
+    almacen["limitador"].pop(usuario, None)
+    almacen["limitador"][usuario] = [fichas - 1, ahora]
+
+    # si hay demasiados usuarios (por ejemplo, probando nombres al azar)
+    # olvidamos los que llevan mas tiempo sin fallar, pero solo si ya
+    # pueden volver a intentarlo: olvidar un cubo vacio desbloquearia al
+    # usuario. Los bloqueados se pasan al final y se miran como mucho
+    # REVISIONES_LIMITADOR entradas por intento, asi que el limitador
+    # puede pasarse del tamaño un tiempo (cada entrada bloqueada le
+    # cuesta al atacante capacidad hashes lentos)
+    limitador = almacen["limitador"]
+    for _ in range(REVISIONES_LIMITADOR):
+        if len(limitador) <= almacen["tamano_limitador"]:
+            break
+        mas_antiguo = next(iter(limitador))
+        # tampoco olvidamos al usuario que acaba de fallar
+        if mas_antiguo == usuario or _fichas(almacen, mas_antiguo, ahora) < 1:
+            limitador[mas_antiguo] = limitador.pop(mas_antiguo)
+        else:
+            limitador.pop(mas_antiguo, None)
+
+
+def _resumen_cache(almacen, usuario, password):
+    """ Resumen rapido (HMAC) de la contraseña para la cache """
+
+    sal = almacen["usuarios"][usuario][0]
+    return hmac.new(almacen["clave_cache"], sal + password.encode("utf-8"), hashlib.sha256).digest()
+
+
+def verificar(almacen, usuario, password):
+    """ Comprueba las credenciales y devuelve ACCESO_PERMITIDO,
+    ACCESO_DENEGADO o DEMASIADOS_INTENTOS """
+    # INPUT:
+    # - almacen: dict creado con crear_almacen
+    # - usuario: str
+    # - password: str
+
+    # solo los intentos fallidos gastan fichas, asi un usuario que entra
+    # muchas veces con la contraseña correcta nunca se bloquea
+    ahora = time.monotonic()
+    if _fichas(almacen, usuario, ahora) < 1:
+        return DEMASIADOS_INTENTOS
+
+    if usuario not in almacen["usuarios"]:
+        # calculamos igualmente un hash para que no se pueda saber por el
+        # tiempo de respuesta si el usuario existe
+        derivar_hash(password, b"\x00" * 16, almacen["iteraciones"])
+        _gastar_ficha(almacen, usuario, ahora)
+        return ACCESO_DENEGADO
+
+    # si el usuario entro hace poco con la misma contraseña evitamos el hash lento
+    resumen = _resumen_cache(almacen, usuario, password)
+    if usuario in almacen["cache"] and hmac.compare_digest(almacen["cache"][usuario], resumen):
+        return ACCESO_PERMITIDO
+
+    sal, hash_guardado = almacen["usuarios"][usuario]
+    # compare_digest tarda lo mismo aunque los hashes difieran al principio
+    if not hmac.compare_digest(derivar_hash(password, sal, almacen["iteraciones"]), hash_guardado):
+        _gastar_ficha(almacen, usuario, ahora)
+        return ACCESO_DENEGADO
+
+    # guardamos el acceso en la cache, quitando el mas antiguo si esta llena
+    almacen["cache"].pop(usuario, None)
+    if len(almacen["cache"]) >= almacen["tamano_cache"]:
+        del almacen["cache"][next(iter(almacen["cache"]))]
+    almacen["cache"][usuario] = resumen
+
+    return ACCESO_PERMITIDO
@@ -0,0 +1,105 @@
+# Verificacion masiva de credenciales repartida entre procesos
+# Cada registro es una tupla (usuario, password, sal, hash) y se comprueba
+# que el hash PBKDF2 de la contraseña con la sal coincide con el guardado.
+# El hash es lento a proposito (mucho calculo), asi que los registros se
+# reparten en fragmentos entre varios procesos para usar todos los nucleos.
+
+import hmac
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import autenticacion
+
+
+def leer_registros(ruta):
+    """ Lee registros de un fichero "usuario,password,sal_hex,hash_hex" """
+    # INPUT:
+    # - ruta: str
+
+    with open(ruta, encoding = "utf-8") as fichero:
+        for linea in fichero:
+            linea = linea.rstrip("\n")
+            if not linea:
+                continue
+            # el usuario no lleva comas, la contraseña puede llevarlas
+            usuario, resto = linea.split(",", 1)
+            password, sal, hash_guardado = resto.rsplit(",", 2)
+            yield usuario, password, bytes.fromhex(sal), bytes.fromhex(hash_guardado)
+
+
+def registros_de_almacen(almacen, nombres_usuario, passwords):
+    """ Crea los registros a partir de las listas de usuarios y contraseñas
+    y de los hashes guardados en un almacen de autenticacion """
+
+    i = 0
+    while i < len(nombres_usuario):
+        sal, hash_guardado = almacen["usuarios"][nombres_usuario[i]]
+        yield nombres_usuario[i], passwords[i], sal, hash_guardado
+        i = i + 1
+
+
+def _verificar_fragmento(registros, iteraciones):
+    """ Verifica un fragmento de registros (se ejecuta en cada proceso).
+    Devuelve (numero de registros, lista de usuarios que fallan) """
+
+    fallidos = []
+    for usuario, password, sal, hash_guardado in registros:
+        if not hmac.compare_digest(autenticacion.derivar_hash(password, sal, iteraciones), hash_guardado):
+            fallidos.append(usuario)
+
+    return len(registros), fallidos
+
+
+def _fragmentos(registros, tamano_fragmento):
+    """ Agrupa los registros en listas de tamano_fragmento """
+
+    fragmento = []
+    for registro in registros:
+        fragmento.append(registro)
+        if len(fragmento) == tamano_fragmento:
+            yield fragmento
+            fragmento = []
+    if fragmento:
+        yield fragmento
+
+
+def verificar_en_lotes(registros, iteraciones = autenticacion.ITERACIONES, procesos = None, tamano_fragmento = 32):
+    """ Verifica los registros en varios procesos y va devolviendo
+    (generador) el progreso cada vez que termina un fragmento:
+    {"verificados": total hasta ahora, "fallidos": usuarios fallidos del
+     fragmento, "por_segundo": registros por segundo hasta ahora} """
+    # INPUT:
+    # - registros: iterable de (usuario, password, sal, hash)
+    # - iteraciones: int, iteraciones de PBKDF2 con las que se guardaron
+    # - procesos: int, numero de procesos (por defecto uno por nucleo)
+    # - tamano_fragmento: int, registros que se envian juntos a un proceso
+
+    procesos = procesos or os.cpu_count()
+    inicio = time.perf_counter()
+    verificados = 0
+
+    with ProcessPoolExecutor(max_workers = procesos) as ejecutor:
+        pendientes = set()
+        fragmentos = _fragmentos(registros, tamano_fragmento)
+        quedan_fragmentos = True
+
+        while quedan_fragmentos or pendientes:
+            # mantenemos como mucho dos fragmentos por proceso en marcha,
+            # asi no cargamos todos los registros en memoria
+            while quedan_fragmentos and len(pendientes) < 2 * procesos:
+                fragmento = next(fragmentos, None)
+                if fragmento is None:
+                    quedan_fragmentos = False
+                else:
+                    pendientes.add(ejecutor.submit(_verificar_fragmento, fragmento, iteraciones))
+
+            terminados, pendientes = wait(pendientes, return_when = FIRST_COMPLETED)
+            for futuro in terminados:
+                numero, fallidos = futuro.result()
+                verificados += numero
+                yield {
+                    "verificados": verificados,
+                    "fallidos": fallidos,
+                    "por_segundo": verificados / (time.perf_counter() - inicio)
+                }
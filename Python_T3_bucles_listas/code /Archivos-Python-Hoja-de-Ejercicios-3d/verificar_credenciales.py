@@ -0,0 +1,36 @@
+""" Verificacion masiva de credenciales despues de un cambio de politica.
+
+Uso: python verificar_credenciales.py [registros.csv]
+El fichero tiene una linea "usuario,password,sal_hex,hash_hex" por registro.
+Si no se indica fichero se verifican los usuarios de validador_acceso_2.
+"""
+
+import sys
+
+import autenticacion
+import verificador_lotes
+
+# el codigo principal va dentro de este if porque los procesos de
+# ProcessPoolExecutor vuelven a importar este fichero al arrancar
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        registros = verificador_lotes.leer_registros(sys.argv[1])
+    else:
+        # usuarios del ejercicio; la contraseña de pedro789 ya no coincide
+        nombres_usuario = ["juan123", "ana456", "pedro789"]
+        passwords = ["clave123", "clave456", "clave789"]
+        almacen = autenticacion.crear_almacen()
+        for i in range(len(nombres_usuario)):
+            autenticacion.registrar_usuario(almacen, nombres_usuario[i], passwords[i])
+        autenticacion.registrar_usuario(almacen, "pedro789", "clave_nueva")
+
+        registros = verificador_lotes.registros_de_almacen(almacen, nombres_usuario, passwords)
+
+    total_fallidos = 0
+    for progreso in verificador_lotes.verificar_en_lotes(registros):
+        for usuario in progreso["fallidos"]:
+            print("Credenciales incorrectas:", usuario)
+        total_fallidos += len(progreso["fallidos"])
+        print(f"Verificados: {progreso['verificados']} ({progreso['por_segundo']:.1f} por segundo)")
+
+    print("Total de credenciales incorrectas:", total_fallidos)
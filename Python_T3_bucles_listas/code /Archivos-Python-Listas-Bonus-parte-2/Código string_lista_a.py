@@ -8,6 +8,8 @@ listas donde se encuentra la información de todos los alumnos e imprimir
 la nota media de los alumnos junto con el DNI.
 
 '''
+import lector_alumnos
+
 # base de datos (lista de listas con los datos de los alumnos)
 base_datos = [["Alvaro", "Gomez", "87654327B", "64782", "1", "7.6", "5.4", "9.3"]]
 
@@ -20,15 +22,14 @@ datos_alumno = cadena.split() # split separara la cadena en una lista de valores
 # introducir la lista con los datos del alumno en la base de datos
 base_datos.append(datos_alumno)
 
-for alumno in base_datos:
-    dni = alumno[2] # extraemos el dni del alumno
-    # calculculamos la media del alumno
-    suma_notas = 0 # iniciamos la variable suma notas en 0 para cada alumno
-    n_notas = 0
-    for i in range(5,len(alumno)): # recorremos todas las notas del alumno
-        suma_notas = suma_notas + float(alumno[i]) # sumamos todas las notas las notas del alumno
-        n_notas = n_notas + 1 # calculamos el numero total de notas del alumno
+# empaquetamos los alumnos: las notas se convierten a float una sola vez
+# y se guardan todas juntas en un array
+bloque = lector_alumnos.empaquetar(base_datos)
+# calculamos la nota media de todos los alumnos de una vez
+notas_medias = lector_alumnos.medias(bloque)
 
-    nota_media = suma_notas / n_notas # calculamos la nota media del alumno
+for i in range(len(bloque["dnis"])):
+    dni = bloque["dnis"][i] # extraemos el dni del alumno
+    nota_media = notas_medias[i] # extraemos la nota media del alumno
 
     print(f"El alumno con dni {dni} tiene una nota media de {nota_media:.2f}")
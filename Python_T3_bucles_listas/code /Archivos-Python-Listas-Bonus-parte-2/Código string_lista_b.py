@@ -6,6 +6,8 @@ Juan Perez 647829236A 43527 2 8.1 8.5 8.4\n ''’
 
 '''
 
+import lector_alumnos
+
 # base de datos (lista de listas con los datos de los alumnos)
 base_datos = [["Alvaro", "Gomez", "87654327B", "64782", "1", "7.6", "5.4", "9.3"]]
 
@@ -29,16 +31,14 @@ for alumno in alumnos:  # recorremos todos los strings de la lista
 
 # --- realizamos el calculo de la nota media para cada alumno
 
-for alumno in base_datos:
-    dni = alumno[2] # extraemos el dni del alumno
-    # calculculamos la media del alumno
-    suma_notas = 0 # iniciamos la variable suma notas en 0 para cada alumno
-    n_notas = 0
-    for i in range(5,len(alumno)): # recorremos todas las notas del alumno
-        suma_notas = suma_notas + float(alumno[i]) # sumamos todas las notas las notas del alumno
-        n_notas = n_notas + 1 # calculamos el numero total de notas del alumno
+# empaquetamos los alumnos: las notas se convierten a float una sola vez
+# y se guardan todas juntas en un array
+bloque = lector_alumnos.empaquetar(base_datos)
+# calculamos la nota media de todos los alumnos de una vez
+notas_medias = lector_alumnos.medias(bloque)
 
-    nota_media = suma_notas / n_notas # calculamos la nota media del alumno
+for i in range(len(bloque["dnis"])):
+    dni = bloque["dnis"][i] # extraemos el dni del alumno
+    nota_media = notas_medias[i] # extraemos la nota media del alumno
 
     print(f"El alumno con dni {dni} tiene una nota media de {nota_media:.2f}")
-
@@ -0,0 +1,88 @@
+# Lectura de listados de alumnos con notas
+# Cada alumno es una linea separada por espacios:
+#   nombre apellido DNI codigo_asignatura convocatoria nota1 nota2 nota3 ...
+# (cada alumno puede tener un numero distinto de notas)
+# Las notas se convierten a float una sola vez y se guardan juntas en un
+# array, con otro array que indica donde empiezan las notas de cada alumno:
+# {
+#   "dnis": ["12311267A", ...],
+#   "datos": [[nombre, apellido, codigo_asignatura, convocatoria], ...],
+#   "notas": array([2.1, 4.6, 3.4, 7.6, ...]),
+#   "inicios": array([0, 3, ...])   <- posicion de la primera nota de cada alumno
+# }
+
+from itertools import islice
+
+import numpy as np
+
+# posicion de la primera nota dentro de los datos de un alumno
+PRIMERA_NOTA = 5
+
+
+def empaquetar(registros):
+    """ Empaqueta una lista de alumnos (cada uno una lista de strings
+    con sus datos) en el formato de bloque descrito arriba """
+    # INPUT:
+    # - registros: iterable de listas de str
+
+    dnis = []
+    datos = []
+    notas = []
+    inicios = []
+    for registro in registros:
+        dnis.append(registro[2])
+        datos.append([registro[0], registro[1], registro[3], registro[4]])
+        inicios.append(len(notas))
+        notas.extend(registro[PRIMERA_NOTA:])
+
+    bloque = {
+        "dnis": dnis,
+        "datos": datos,
+        # convertimos todas las notas del bloque a float de una vez
+        "notas": np.array(notas, dtype = float),
+        "inicios": np.array(inicios, dtype = np.int64)
+    }
+
+    return bloque
+
+
+def parsear_lineas(lineas):
+    """ Empaqueta los alumnos de una lista de lineas de texto
+    (ignora las lineas vacias) """
+
+    return empaquetar(linea.split() for linea in lineas if linea.strip())
+
+
+def leer_fichero(ruta, tamano_bloque = 100000):
+    """ Lee un fichero de alumnos por bloques de tamano_bloque lineas
+    y devuelve (generador) un bloque empaquetado cada vez, asi la
+    memoria no depende del tamaño del fichero """
+    # INPUT:
+    # - ruta: str
+    # - tamano_bloque: int
+
+    with open(ruta, encoding = "utf-8") as fichero:
+        while True:
+            lineas = list(islice(fichero, tamano_bloque))
+            if not lineas:
+                break
+            yield parsear_lineas(lineas)
+
+
+def medias(bloque):
+    """ Devuelve un array con la nota media de cada alumno del bloque
+    (nan si el alumno no tiene notas) """
+
+    notas = bloque["notas"]
+    inicios = bloque["inicios"]
+
+    # numero de notas de cada alumno
+    cantidades = np.diff(np.append(inicios, len(notas)))
+    con_notas = cantidades > 0
+
+    # reduceat suma las notas entre cada inicio y el siguiente
+    # (solo usamos los alumnos con notas, reduceat no admite tramos vacios)
+    resultado = np.full(len(inicios), np.nan)
+    resultado[con_notas] = np.add.reduceat(notas, inicios[con_notas]) / cantidades[con_notas]
+
+    return resultado
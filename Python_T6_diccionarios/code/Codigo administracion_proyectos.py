@@ -1,22 +1,34 @@
-# diccionario base de datos
-tareas = {}
+import almacen_tareas
+
+# base de datos de tareas con indices por responsable y por palabras
+tareas = almacen_tareas.crear_almacen()
 
 # Agregar tareas nuevas
-tareas["Tarea1"] = {"descripcion": "Realizar analisis de requisitos", "responsable": "Juan"}
-tareas["Tarea2"] = {"descripcion": "Desarrollar funcionalidad principal", "responsable": "Marta"}
-tareas["Tarea3"] = {"descripcion": "Realizar validacion de proceso", "responsable": "Jacobo"}
+almacen_tareas.agregar_tarea(tareas, "Tarea1", "Realizar analisis de requisitos", "Juan")
+almacen_tareas.agregar_tarea(tareas, "Tarea2", "Desarrollar funcionalidad principal", "Marta")
+almacen_tareas.agregar_tarea(tareas, "Tarea3", "Realizar validacion de proceso", "Jacobo")
 
 # Asignar responsables a las tareas existentes
-tareas["Tarea1"]["responsable"] = "Elena"
-tareas["Tarea3"]["responsable"] = "Maria"
+almacen_tareas.asignar_responsable(tareas, "Tarea1", "Elena")
+almacen_tareas.asignar_responsable(tareas, "Tarea3", "Maria")
 
 # Actualizar las descripciones de las tareas
-tareas["Tarea2"]["descripcion"] = "Realizar test de hiperparametros"
+almacen_tareas.actualizar_descripcion(tareas, "Tarea2", "Realizar test de hiperparametros")
 
-# Mostrar la lista de tareas y responsables
+# Mostrar la lista de tareas y responsables (pagina a pagina)
 print("Lista de Tareas y Responsables:")
-for tarea, detalles in tareas.items():
-    print("Tarea", tarea)
-    print("Descripcion:", detalles["descripcion"])
-    print("Responsable:", detalles["responsable"])
-    print()
\ No newline at end of file
+pagina = 1
+tareas_pagina = almacen_tareas.listar_pagina(tareas, pagina, tamano_pagina = 2)
+while len(tareas_pagina) > 0:
+    print("-- Pagina", pagina, "--")
+    for tarea, detalles in tareas_pagina:
+        print("Tarea", tarea)
+        print("Descripcion:", detalles["descripcion"])
+        print("Responsable:", detalles["responsable"])
+        print()
+    pagina += 1
+    tareas_pagina = almacen_tareas.listar_pagina(tareas, pagina, tamano_pagina = 2)
+
+# Consultas usando los indices
+print("Tareas de Elena:", almacen_tareas.tareas_de(tareas, "Elena"))
+print("Tareas que contienen 'realizar':", almacen_tareas.buscar(tareas, "realizar"))
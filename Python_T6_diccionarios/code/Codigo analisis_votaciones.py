@@ -1,4 +1,21 @@
-resultados = {}
+import diario_votos
+import recuento_votos
+
+# fichero donde se guardan los votos para no perderlos al cerrar
+RUTA_DIARIO = "votos.log"
+
+# el recuento guarda los votos por candidato, el total y el lider
+recuento = recuento_votos.crear_recuento()
+resultados = recuento["votos"]
+
+# recuperamos los votos de sesiones anteriores desde el diario
+votos_guardados, registros_invalidos = diario_votos.recontar(RUTA_DIARIO)
+for candidato, votos in votos_guardados.items():
+    recuento_votos.registrar_votos(recuento, candidato, votos)
+if registros_invalidos > 0:
+    print(f"Atencion: se han ignorado {registros_invalidos} votos dañados del diario")
+
+diario = diario_votos.abrir_diario(RUTA_DIARIO)
 
 continuar = True
 while continuar:
@@ -6,7 +23,8 @@ while continuar:
     print("2. Mostrar lista de candidatos y votos")
     print("3. Encontrar candidato ganador")
     print("4. Calcular porcentaje de votos")
-    print("5. Salir")
+    print("5. Verificar recuento con el diario")
+    print("6. Salir")
     opcion = input("Seleccione un opción: ")
 
 
@@ -14,14 +32,11 @@ while continuar:
     if opcion == "1":
         # pedimos nombre de candidato
         candidato = input("Ingrese nombre del candidato: ")
-        # comprobamos si el candidato esta en la base de datos
-        if candidato in resultados:
-            # sumamos voto
-            resultados[candidato] = resultados[candidato] + 1
-        # si no esta en la base de datos añadimos par clave valor
-        else:
-            # añadimos voto
-            resultados[candidato] = 1
+        # sumamos el voto (si el candidato no existe se añade)
+        # y se actualizan el total y el lider
+        recuento_votos.registrar_voto(recuento, candidato)
+        # lo guardamos en el diario
+        diario_votos.escribir_voto(diario, candidato)
 
         print("Voto registrado satisfactoriamente")
 
@@ -42,20 +57,29 @@ while continuar:
 
         # si hay votaciones registadas
         else:
-            # extraemos la clave asociada al numero de votos mas alto
-            ganador = max(resultados, key = resultados.get)
+            # el lider se actualiza con cada voto, no hace falta buscar el maximo
+            ganador = recuento_votos.ganador(recuento)
             print(f"El candidato ganador es: {ganador}")
 
     # Calcular el porcentaje de votos
     elif opcion == "4":
-        total_votos = sum(resultados.values())
         print("Porcentaje de votos por candidato")
-        for candidato, votos in resultados.items():
-            porcentaje = (votos/total_votos) * 100
+        for candidato in resultados:
+            # el total de votos se mantiene en el recuento, no hace falta sumarlo
+            porcentaje = recuento_votos.porcentaje(recuento, candidato)
             print(f"Candidato: {candidato}, Porcentaje de votos {porcentaje:.2f}%")
 
-    # Cerrar script
+    # Verificar que el diario en disco coincide con los votos en memoria
     elif opcion == "5":
+        diario_votos.sincronizar(diario)
+        if diario_votos.verificar(RUTA_DIARIO, resultados):
+            print("El recuento del diario coincide con los votos registrados")
+        else:
+            print("El recuento del diario NO coincide con los votos registrados")
+
+    # Cerrar script
+    elif opcion == "6":
+        diario_votos.cerrar_diario(diario)
         print("Cerrando votaciones")
         continuar = False
 
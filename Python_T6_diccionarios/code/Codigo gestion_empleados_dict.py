@@ -1,6 +1,12 @@
+# importamos el modulo de indices
+import indice_empleados
+
 # base de datos diccionario
 empleados = {}
 
+# indices por departamento (suma y contador) y por salario (lista ordenada)
+indice = indice_empleados.crear_indice()
+
 # condicion del while veradera
 continuar = True
 
@@ -11,7 +17,8 @@ while continuar:
     print("2. Actualizar salario de empleados")
     print("3. Mostrar lista de empleados")
     print("4. Calcular promedio salarial por departamente")
-    print("5. Salir")
+    print("5. Buscar empleados por rango salarial")
+    print("6. Salir")
     opcion = input("Seleccione una opcion: ")
 
     # Agregar empleado
@@ -20,10 +27,16 @@ while continuar:
         salario = float(input("Ingrese salario del empleado: "))
         departamento = input("Ingrese departamento del empleado: ")
 
+        # si el empleado ya existia lo quitamos antes del indice
+        if nombre in empleados:
+            anterior = empleados[nombre]
+            indice_empleados.desindexar_empleado(indice, nombre, anterior["salario"], anterior["departamento"])
+
         empleados[nombre] = {
             "salario": salario,
             "departamento": departamento
         }
+        indice_empleados.indexar_empleado(indice, nombre, salario, departamento)
 
         print("Empleado agregado exitosamente")
 
@@ -34,7 +47,9 @@ while continuar:
         if nombre in empleados:
             # pedimos nuevo salario
             nuevo_salario = float(input("Ingrese el nuevo salario del empleado: "))
-            # actualizamos salario del empleado
+            # actualizamos el indice y el salario del empleado
+            indice_empleados.actualizar_salario_indice(indice, nombre, empleados[nombre]["departamento"],
+                                                       empleados[nombre]["salario"], nuevo_salario)
             empleados[nombre]["salario"] = nuevo_salario
             print("Salario actualizado exitosamente")
         # si el empleado no existe en la base de datos lo indicamos
@@ -55,25 +70,31 @@ while continuar:
     elif opcion == "4":
         departamento = input("Ingrese el departamento: ")
 
-        # inicializamos variables
-        total_salarios = 0
-        contador = 0
-        # recorremos datos de los empleados guardados en los valores del dict
-        for datos_empleado in empleados.values():
-            # si el departamento coincide sumamos el salario
-            if datos_empleado["departamento"] == departamento:
-                total_salarios = total_salarios + datos_empleado["salario"]
-                contador = contador + 1
-
-        # si hay empleados en el departament calculamos el promedio
-        if contador > 0:
-            promedio_salario = total_salarios / contador
+        # el indice guarda la suma y el contador de cada departamento,
+        # asi no tenemos que recorrer todos los empleados
+        promedio_salario = indice_empleados.promedio_departamento(indice, departamento)
+
+        # si hay empleados en el departament mostramos el promedio
+        if promedio_salario is not None:
             print(f"Promedio salarial del departamento {departamento}: {promedio_salario}")
         # si no hay empleados en el departamento lo indicamos
         else:
             print(f"No hay empleados en el departamento {departamento}")
 
+    # Buscar empleados por rango salarial
     elif opcion == "5":
+        salario_minimo = float(input("Ingrese el salario minimo: "))
+        salario_maximo = float(input("Ingrese el salario maximo: "))
+
+        # el indice de salarios esta ordenado, buscamos el rango por biseccion
+        encontrados = indice_empleados.empleados_en_rango(indice, salario_minimo, salario_maximo)
+        if len(encontrados) > 0:
+            for salario, nombre in encontrados:
+                print(f"Nombre: {nombre}, Salario: {salario}, Departamento: {empleados[nombre]['departamento']}")
+        else:
+            print("No hay empleados en ese rango salarial")
+
+    elif opcion == "6":
         print("Cerrando programa")
         continuar = False
 
@@ -1,4 +1,10 @@
-empleados = []
+import almacenes_empleados
+
+# Almacen de empleados. Se puede cambiar por
+# almacenes_empleados.crear_almacen_diccionario() o
+# almacenes_empleados.crear_almacen_sqlite("empleados.db")
+# sin modificar el menu (ver benchmark_almacenes.py)
+almacen = almacenes_empleados.crear_almacen_lista()
 
 continuar = True
 while continuar:
@@ -19,15 +25,8 @@ while continuar:
         salario = float(input("Ingrese el salario del empleado: "))
         departamento = input("Ingrese el departamento del empleado: ")
 
-        # Creamos un diccionario con la información del empleado
-        empleado = {
-            "nombre": nombre,
-            "salario": salario,
-            "departamento": departamento
-        }
-
-        # Agregamos el empleado a la lista de empleados
-        empleados.append(empleado)
+        # Agregamos el empleado al almacen
+        almacen["agregar"](nombre, salario, departamento)
         print("Empleado agregado exitosamente.")
 
     # Actualizar el salario de un empleado existente
@@ -35,35 +34,22 @@ while continuar:
         nombre = input("Ingrese el nombre del empleado: ")
         nuevo_salario = float(input("Ingrese el nuevo salario del empleado: "))
 
-        # Buscamos al empleado por su nombre
-        for empleado in empleados:
-            if empleado["nombre"] == nombre:
-                # Actualizamos el salario del empleado encontrado
-                empleado["salario"] = nuevo_salario
-                break
-        else:
+        # Buscamos al empleado por su nombre y actualizamos su salario
+        if not almacen["actualizar_salario"](nombre, nuevo_salario):
             print("Empleado no encontrado.")
 
     # Mostrar la lista de empleados
     elif opcion == "3":
-        for empleado in empleados:
+        for empleado in almacen["listar"]():
             print(f"Nombre: {empleado['nombre']}, Salario: {empleado['salario']}, Departamento: {empleado['departamento']}")
 
     # Calcular el promedio salarial por departamento
     elif opcion == "4":
         departamento = input("Ingrese el departamento: ")
-        total_salarios = 0
-        contador = 0
-
-        # Recorremos la lista de empleados y realizamos el cálculo
-        for empleado in empleados:
-            if empleado["departamento"] == departamento:
-                total_salarios += empleado["salario"]
-                contador += 1
+        promedio_salario = almacen["promedio_departamento"](departamento)
 
         # Verificamos si hay empleados en el departamento y mostramos el resultado
-        if contador > 0:
-            promedio_salario = total_salarios / contador
+        if promedio_salario is not None:
             print(f"Promedio salarial del departamento {departamento}: {promedio_salario}")
         else:
             print(f"No hay empleados en el departamento {departamento}")
@@ -1,18 +1,29 @@
-# diccionario base de datos
-asistencias = dict()
+import almacen_asistencias
+
+# base de datos de asistencias indexada por estudiante y por fecha
+asistencias = almacen_asistencias.crear_almacen()
 
 # Registrar asistencias de estudiantes
-asistencias["Estudiante1"] = ["2022-01-01", "2022-01-03", "2022-01-05"]
-asistencias["Estudiante2"] = ["2022-01-02", "2022-01-05", "2022-01-07"]
-asistencias["Estudiante3"] = ["2022-01-01", "2022-01-07", "2022-01-09"]
+for fecha in ["2022-01-01", "2022-01-03", "2022-01-05"]:
+    almacen_asistencias.registrar_asistencia(asistencias, "Estudiante1", fecha)
+for fecha in ["2022-01-02", "2022-01-05", "2022-01-07"]:
+    almacen_asistencias.registrar_asistencia(asistencias, "Estudiante2", fecha)
+for fecha in ["2022-01-01", "2022-01-07", "2022-01-09"]:
+    almacen_asistencias.registrar_asistencia(asistencias, "Estudiante3", fecha)
 
 # Agregar nuevas fechas de asistencia para un estudiante existente
-asistencias["Estudiante1"].append("2022-01-07")
-asistencias["Estudiante2"].append("2022-01-09")
+almacen_asistencias.registrar_asistencia(asistencias, "Estudiante1", "2022-01-07")
+almacen_asistencias.registrar_asistencia(asistencias, "Estudiante2", "2022-01-09")
 
 # Mostrar la lista de estudiantes y las fechas en las que asistieron
 print("Registro de Asitencias:")
-for estudiante, fechas in asistencias.items():
+for estudiante in asistencias["por_estudiante"]:
     print("Estudiante:", estudiante)
-    print("Fechas de Asistencia:", ", ".join(fechas))
-    print()
\ No newline at end of file
+    print("Fechas de Asistencia:", ", ".join(almacen_asistencias.fechas_estudiante(asistencias, estudiante)))
+    tasa = almacen_asistencias.tasa_asistencia(asistencias, estudiante, "2022-01-01", "2022-01-31")
+    print(f"Asistencia en enero: {tasa * 100:.0f}%")
+    print("Racha maxima de asistencia:", almacen_asistencias.racha_maxima(asistencias, estudiante))
+    print()
+
+# Consultar quien asistio en una fecha usando el indice por fecha
+print("Asistentes el 2022-01-07:", ", ".join(sorted(almacen_asistencias.asistentes(asistencias, "2022-01-07"))))
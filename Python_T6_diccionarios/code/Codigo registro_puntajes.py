@@ -1,5 +1,7 @@
-# base de datos con puntajes
-registros = {}
+import clasificacion
+
+# base de datos con puntajes, ordenados de mayor a menor
+registros = clasificacion.crear_clasificacion()
 continuar = True
 
 
@@ -11,20 +13,24 @@ while continuar:
         continuar = False
     else:
         puntaje = int(input("Ingrese el puntaje del jugador: "))
-        registros[nombre] = puntaje
+        clasificacion.actualizar_puntaje(registros, nombre, puntaje)
+        print("Posicion del jugador:", clasificacion.posicion(registros, nombre))
+
+    # si todavia no hay jugadores no hay nada que mostrar
+    cantidad_jugadores = clasificacion.cantidad_jugadores(registros)
+    if cantidad_jugadores == 0:
+        print("No hay jugadores registrados")
+        continue
 
-    # Obtener puntaje más alto
-    jugador_mas_alto = max(registros, key=registros.get)
-    puntaje_mas_alto = registros[jugador_mas_alto]
+    # Obtener puntaje más alto (el primero de la clasificacion)
+    jugador_mas_alto, puntaje_mas_alto = clasificacion.mejores(registros, 1)[0]
     print("Puntaje más alto:")
     print("Jugador:", jugador_mas_alto)
     print("Puntaje:", puntaje_mas_alto)
 
-    # Obtener el promedio de puntajes
-    total_puntajes = sum(registros.values())
-    cantidad_jugadores = len(registros)
-    promedio = total_puntajes / cantidad_jugadores
+    # Obtener el promedio de puntajes (la suma se mantiene en la clasificacion)
+    promedio = clasificacion.promedio(registros)
     print("Promedio de puntajes:", promedio)
 
     # Cantidad total de jugadores
-    print("La cantidad de jugadores es: ", cantidad_jugadores)
\ No newline at end of file
+    print("La cantidad de jugadores es: ", cantidad_jugadores)
@@ -1,9 +1,26 @@
-ventas_diarias = {}
+import sys
+from collections import Counter
 
-continuar = True
+import ingesta_ventas
+
+ventas_diarias = Counter()
+# total de ventas, se actualiza con cada venta para no tener que sumarlo
+total_ventas = 0
+
+# Modo de carga masiva: python "Codigo registro_ventas_dificil.py" ventas.csv
+# (o "-" para leer las ventas de la entrada estandar)
+if len(sys.argv) > 1:
+    for ruta in sys.argv[1:]:
+        cantidad, numero_ventas = ingesta_ventas.ingerir_fichero(ventas_diarias, ruta)
+        total_ventas += cantidad
+        print(f"Cargadas {numero_ventas} ventas desde {ruta}")
+    print("El total de ventas diarias es:", total_ventas)
+    continuar = False
+else:
+    continuar = True
 
 while continuar:
-    opcion = input("1. Registrar venta\n2. Actualizar cantidad vendida\n3. Calcular total de ventas\n4. Salir\nElige una opción: ")
+    opcion = input("1. Registrar venta\n2. Actualizar cantidad vendida\n3. Calcular total de ventas\n4. Cargar ventas desde fichero\n5. Salir\nElige una opción: ")
 
     # Registrar ventas
     if opcion == "1":
@@ -18,6 +35,7 @@ while continuar:
         # el prodcuto y la cantidad vendida
         else:
             ventas_diarias[producto] = cantidad
+        total_ventas += cantidad
 
     # Actualizar la cantidad vendida
     elif opcion == "2":
@@ -28,6 +46,8 @@ while continuar:
             # Pedimos la cantidad vendida de ese producto
             nueva_cantidad = int(input("Ingrese la nueva cantidad vendida: "))
             # Actualizamos la cantidad total de unidades vendidas
+            # y corregimos el total con la diferencia
+            total_ventas += nueva_cantidad - ventas_diarias[producto]
             ventas_diarias[producto] = nueva_cantidad
         # En el caso de que el producto no exista en la base de datos lo indicamos
         else:
@@ -35,20 +55,28 @@ while continuar:
 
     # Calcular el total de las ventas
     elif opcion == "3":
-        total = 0
-        # recorremos los valores del diccionario
-        for cantidad in ventas_diarias.values():
-            # los sumamos al valor total de ventas
-            total += cantidad
-        # imprimimos el valor total de las ventas
-        print("El total de ventas diarias es:", total)
+        # el total se va actualizando con cada venta, no hace falta recorrer el diccionario
+        print("El total de ventas diarias es:", total_ventas)
 
-    # Salir del programa
+    # Cargar ventas desde un fichero "producto,cantidad"
     elif opcion == "4":
+        ruta = input("Ingrese la ruta del fichero de ventas: ")
+        # si el fichero no existe o tiene una linea mal formada avisamos
+        # sin perder las ventas registradas (el fichero no se carga)
+        try:
+            cantidad, numero_ventas = ingesta_ventas.ingerir_fichero(ventas_diarias, ruta)
+        except (OSError, ValueError) as error:
+            print("No se ha podido cargar el fichero:", error)
+        else:
+            total_ventas += cantidad
+            print(f"Cargadas {numero_ventas} ventas desde {ruta}")
+
+    # Salir del programa
+    elif opcion == "5":
         print("Saliendo del programa...")
         continuar = False
 
-    # Si el numero introducido no es 1,2,3,4 pedimos que se elija
+    # Si el numero introducido no es 1,2,3,4,5 pedimos que se elija
     # una opcion valida
     else:
         print("Opción inválida. Por favor, elija una opción válida.")
@@ -0,0 +1,121 @@
+# Almacen de asistencias indexado por estudiante y por fecha
+# Las fechas se guardan como ordinales (numero de dia, date.toordinal())
+# Estructura del almacen:
+# {
+#   "por_estudiante": {"estudiante": [dia, dia, ...]},   <- listas ordenadas
+#   "por_fecha": {dia: {"estudiante", ...}},            <- indice invertido
+#   "dias_lectivos": [dia, dia, ...]                     <- dias con alguna asistencia, ordenados
+# }
+
+import bisect
+from datetime import date
+
+
+def fecha_a_dia(fecha):
+    """ Convierte una fecha "AAAA-MM-DD" en su ordinal """
+
+    return date.fromisoformat(fecha).toordinal()
+
+
+def dia_a_fecha(dia):
+    """ Convierte un ordinal en una fecha "AAAA-MM-DD" """
+
+    return date.fromordinal(dia).isoformat()
+
+
+def crear_almacen():
+    """ Crea un almacen de asistencias vacio """
+
+    almacen = {
+        "por_estudiante": {},
+        "por_fecha": {},
+        "dias_lectivos": []
+    }
+
+    return almacen
+
+
+def registrar_asistencia(almacen, estudiante, fecha):
+    """ Registra que el estudiante asistio en la fecha indicada """
+    # INPUT:
+    # - almacen: dict creado con crear_almacen
+    # - estudiante: str
+    # - fecha: str "AAAA-MM-DD"
+
+    dia = fecha_a_dia(fecha)
+
+    # lista ordenada de dias del estudiante (sin repetir)
+    dias = almacen["por_estudiante"].setdefault(estudiante, [])
+    posicion = bisect.bisect_left(dias, dia)
+    if posicion < len(dias) and dias[posicion] == dia:
+        return
+    dias.insert(posicion, dia)
+
+    # indice invertido fecha -> estudiantes
+    if dia not in almacen["por_fecha"]:
+        almacen["por_fecha"][dia] = set()
+        bisect.insort(almacen["dias_lectivos"], dia)
+    almacen["por_fecha"][dia].add(estudiante)
+
+
+def fechas_estudiante(almacen, estudiante):
+    """ Devuelve las fechas de asistencia del estudiante ordenadas """
+
+    return [dia_a_fecha(dia) for dia in almacen["por_estudiante"].get(estudiante, [])]
+
+
+def asistentes(almacen, fecha):
+    """ Devuelve el conjunto de estudiantes que asistieron en la fecha """
+
+    return almacen["por_fecha"].get(fecha_a_dia(fecha), set())
+
+
+def _contar_en_rango(dias, inicio, fin):
+    """ Cuenta los dias de la lista ordenada entre inicio y fin (incluidos) """
+
+    return bisect.bisect_right(dias, fin) - bisect.bisect_left(dias, inicio)
+
+
+def tasa_asistencia(almacen, estudiante, fecha_inicio, fecha_fin):
+    """ Devuelve la proporcion (0 a 1) de dias lectivos entre las dos
+    fechas en los que asistio el estudiante, o None si no hay dias lectivos """
+    # INPUT:
+    # - almacen: dict creado con crear_almacen
+    # - estudiante: str
+    # - fecha_inicio, fecha_fin: str "AAAA-MM-DD" (incluidas)
+
+    inicio = fecha_a_dia(fecha_inicio)
+    fin = fecha_a_dia(fecha_fin)
+
+    dias_lectivos = _contar_en_rango(almacen["dias_lectivos"], inicio, fin)
+    if dias_lectivos == 0:
+        return None
+
+    dias_asistidos = _contar_en_rango(almacen["por_estudiante"].get(estudiante, []), inicio, fin)
+    return dias_asistidos / dias_lectivos
+
+
+def racha_maxima(almacen, estudiante):
+    """ Devuelve el mayor numero de dias lectivos seguidos
+    en los que asistio el estudiante """
+    # INPUT:
+    # - almacen: dict creado con crear_almacen
+    # - estudiante: str
+
+    dias_lectivos = almacen["dias_lectivos"]
+    racha = 0
+    mejor_racha = 0
+    posicion_anterior = None
+
+    for dia in almacen["por_estudiante"].get(estudiante, []):
+        # posicion del dia dentro de los dias lectivos: si es la siguiente
+        # a la del dia anterior la racha continua
+        posicion = bisect.bisect_left(dias_lectivos, dia)
+        if posicion_anterior is not None and posicion == posicion_anterior + 1:
+            racha += 1
+        else:
+            racha = 1
+        mejor_racha = max(mejor_racha, racha)
+        posicion_anterior = posicion
+
+    return mejor_racha
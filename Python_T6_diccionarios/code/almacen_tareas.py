@@ -0,0 +1,137 @@
+# Almacen de tareas con indices por responsable y por palabras
+# Estructura del almacen:
+# {
+#   "tareas": {"Tarea1": {"descripcion": ..., "responsable": ...}, ...},
+#   "orden": ["Tarea1", ...]   <- tareas en orden de creacion, para paginar
+#   "por_responsable": {"responsable": {"Tarea1", ...}},
+#   "por_palabra": {"palabra": {"Tarea1", ...}}
+# }
+# Los indices se actualizan cada vez que cambia el responsable
+# o la descripcion de una tarea.
+
+import re
+
+
+def crear_almacen():
+    """ Crea un almacen de tareas vacio """
+
+    almacen = {
+        "tareas": {},
+        "orden": [],
+        "por_responsable": {},
+        "por_palabra": {}
+    }
+
+    return almacen
+
+
+def palabras(texto):
+    """ Devuelve el conjunto de palabras del texto en minusculas """
+
+    return set(re.findall(r"\w+", texto.lower()))
+
+
+def _indexar(indice, clave, tarea):
+    """ Añade la tarea al conjunto de la clave """
+
+    indice.setdefault(clave, set()).add(tarea)
+
+
+def _desindexar(indice, clave, tarea):
+    """ Quita la tarea del conjunto de la clave y borra la clave si queda vacia """
+
+    indice[clave].discard(tarea)
+    if len(indice[clave]) == 0:
+        del indice[clave]
+
+
+def agregar_tarea(almacen, tarea, descripcion, responsable):
+    """ Agrega una tarea nueva (o reemplaza una existente) """
+    # INPUT:
+    # - almacen: dict creado con crear_almacen
+    # - tarea: str, identificador de la tarea
+    # - descripcion: str
+    # - responsable: str
+
+    # si la tarea ya existia quitamos sus datos antiguos de los indices
+    if tarea in almacen["tareas"]:
+        asignar_responsable(almacen, tarea, responsable)
+        actualizar_descripcion(almacen, tarea, descripcion)
+        return
+
+    almacen["tareas"][tarea] = {"descripcion": descripcion, "responsable": responsable}
+    almacen["orden"].append(tarea)
+    _indexar(almacen["por_responsable"], responsable, tarea)
+    for palabra in palabras(descripcion):
+        _indexar(almacen["por_palabra"], palabra, tarea)
+
+
+def asignar_responsable(almacen, tarea, responsable):
+    """ Cambia el responsable de una tarea existente """
+    # INPUT:
+    # - almacen: dict creado con crear_almacen
+    # - tarea: str, identificador de la tarea
+    # - responsable: str
+
+    detalles = almacen["tareas"][tarea]
+    _desindexar(almacen["por_responsable"], detalles["responsable"], tarea)
+    detalles["responsable"] = responsable
+    _indexar(almacen["por_responsable"], responsable, tarea)
+
+
+def actualizar_descripcion(almacen, tarea, descripcion):
+    """ Cambia la descripcion de una tarea existente """
+    # INPUT:
+    # - almacen: dict creado con crear_almacen
+    # - tarea: str, identificador de la tarea
+    # - descripcion: str
+
+    detalles = almacen["tareas"][tarea]
+    antiguas = palabras(detalles["descripcion"])
+    nuevas = palabras(descripcion)
+
+    # solo tocamos las palabras que cambian
+    for palabra in antiguas - nuevas:
+        _desindexar(almacen["por_palabra"], palabra, tarea)
+    for palabra in nuevas - antiguas:
+        _indexar(almacen["por_palabra"], palabra, tarea)
+
+    detalles["descripcion"] = descripcion
+
+
+def tareas_de(almacen, responsable):
+    """ Devuelve la lista ordenada de tareas de un responsable """
+
+    return sorted(almacen["por_responsable"].get(responsable, set()))
+
+
+def buscar(almacen, texto):
+    """ Devuelve la lista ordenada de tareas cuya descripcion
+    contiene todas las palabras del texto """
+
+    resultado = None
+    for palabra in palabras(texto):
+        tareas = almacen["por_palabra"].get(palabra, set())
+        # interseccion de las tareas de cada palabra
+        if resultado is None:
+            resultado = set(tareas)
+        else:
+            resultado &= tareas
+
+    if resultado is None:
+        return []
+    return sorted(resultado)
+
+
+def listar_pagina(almacen, pagina, tamano_pagina = 20):
+    """ Devuelve una pagina de tareas como lista de (tarea, detalles),
+    en orden de creacion. La primera pagina es la 1 """
+    # INPUT:
+    # - almacen: dict creado con crear_almacen
+    # - pagina: int
+    # - tamano_pagina: int
+
+    # cortamos la lista de tareas directamente: cada pagina cuesta lo
+    # mismo sea cual sea su numero
+    inicio = (pagina - 1) * tamano_pagina
+    return [(tarea, almacen["tareas"][tarea]) for tarea in almacen["orden"][inicio:inicio + tamano_pagina]]
@@ -0,0 +1,174 @@
+# Almacenes intercambiables para la base de datos de empleados
+# Cada almacen es un diccionario de funciones con las mismas operaciones
+# que el menu de gestion_empleados_list:
+# {
+#   "tipo": "lista" | "diccionario" | "sqlite",
+#   "agregar": funcion(nombre, salario, departamento),
+#   "actualizar_salario": funcion(nombre, nuevo_salario) -> True si existe el empleado,
+#   "listar": funcion() -> lista de diccionarios {"nombre", "salario", "departamento"},
+#   "promedio_departamento": funcion(departamento) -> promedio o None
+# }
+# Asi el programa principal puede cambiar de almacen sin cambiar el menu.
+# Los tres almacenes se comportan igual:
+# - agregar un nombre que ya existe reemplaza sus datos y el empleado
+#   conserva su posicion
+# - listar devuelve copias, en orden de alta
+
+import sqlite3
+
+
+def crear_almacen_lista():
+    """ Almacen basado en una lista de diccionarios.
+    Actualizar y calcular promedios recorre toda la lista """
+
+    empleados = []
+
+    def agregar(nombre, salario, departamento):
+        nuevo = {"nombre": nombre, "salario": salario, "departamento": departamento}
+        # si el nombre ya existe reemplazamos sus datos
+        for posicion, empleado in enumerate(empleados):
+            if empleado["nombre"] == nombre:
+                empleados[posicion] = nuevo
+                return
+        empleados.append(nuevo)
+
+    def actualizar_salario(nombre, nuevo_salario):
+        # buscamos al empleado por su nombre
+        for empleado in empleados:
+            if empleado["nombre"] == nombre:
+                empleado["salario"] = nuevo_salario
+                return True
+        return False
+
+    def listar():
+        return [dict(empleado) for empleado in empleados]
+
+    def promedio_departamento(departamento):
+        total_salarios = 0
+        contador = 0
+        for empleado in empleados:
+            if empleado["departamento"] == departamento:
+                total_salarios += empleado["salario"]
+                contador += 1
+
+        if contador == 0:
+            return None
+        return total_salarios / contador
+
+    almacen = {
+        "tipo": "lista",
+        "agregar": agregar,
+        "actualizar_salario": actualizar_salario,
+        "listar": listar,
+        "promedio_departamento": promedio_departamento
+    }
+
+    return almacen
+
+
+def crear_almacen_diccionario():
+    """ Almacen basado en un diccionario con el nombre como clave.
+    Buscar un empleado es O(1) y el promedio de cada departamento
+    se mantiene con una suma y un contador """
+
+    empleados = {}
+    # {"departamento": {"suma": suma salarios, "contador": n empleados}}
+    departamentos = {}
+
+    def sumar_a_departamento(departamento, salario, cantidad):
+        if departamento not in departamentos:
+            departamentos[departamento] = {"suma": 0, "contador": 0}
+        departamentos[departamento]["suma"] += salario
+        departamentos[departamento]["contador"] += cantidad
+
+        # si el departamento se queda vacio lo borramos
+        if departamentos[departamento]["contador"] == 0:
+            del departamentos[departamento]
+
+    def agregar(nombre, salario, departamento):
+        # si el nombre ya existia quitamos sus datos antiguos de los totales
+        # (al reasignar la clave el diccionario conserva su posicion)
+        if nombre in empleados:
+            anterior = empleados[nombre]
+            sumar_a_departamento(anterior["departamento"], -anterior["salario"], -1)
+
+        empleados[nombre] = {"nombre": nombre, "salario": salario, "departamento": departamento}
+        sumar_a_departamento(departamento, salario, 1)
+
+    def actualizar_salario(nombre, nuevo_salario):
+        if nombre not in empleados:
+            return False
+
+        empleado = empleados[nombre]
+        sumar_a_departamento(empleado["departamento"], nuevo_salario - empleado["salario"], 0)
+        empleado["salario"] = nuevo_salario
+        return True
+
+    def listar():
+        return [dict(empleado) for empleado in empleados.values()]
+
+    def promedio_departamento(departamento):
+        if departamento not in departamentos:
+            return None
+        return departamentos[departamento]["suma"] / departamentos[departamento]["contador"]
+
+    almacen = {
+        "tipo": "diccionario",
+        "agregar": agregar,
+        "actualizar_salario": actualizar_salario,
+        "listar": listar,
+        "promedio_departamento": promedio_departamento
+    }
+
+    return almacen
+
+
+def crear_almacen_sqlite(ruta = ":memory:"):
+    """ Almacen basado en una base de datos SQLite con indices
+    por nombre (clave primaria) y por departamento """
+    # INPUT:
+    # - ruta: str, fichero de la base de datos (por defecto en memoria)
+
+    conexion = sqlite3.connect(ruta)
+    conexion.execute("""CREATE TABLE IF NOT EXISTS empleados (
+                            nombre TEXT PRIMARY KEY,
+                            salario REAL,
+                            departamento TEXT)""")
+    conexion.execute("CREATE INDEX IF NOT EXISTS idx_departamento ON empleados (departamento)")
+
+    def agregar(nombre, salario, departamento):
+        # INSERT OR REPLACE borraria la fila y la pondria al final: con
+        # ON CONFLICT se actualiza y conserva su posicion (rowid)
+        conexion.execute("""INSERT INTO empleados VALUES (?, ?, ?)
+                            ON CONFLICT (nombre) DO UPDATE SET
+                                salario = excluded.salario,
+                                departamento = excluded.departamento""",
+                         (nombre, salario, departamento))
+        conexion.commit()
+
+    def actualizar_salario(nombre, nuevo_salario):
+        cursor = conexion.execute("UPDATE empleados SET salario = ? WHERE nombre = ?",
+                                  (nuevo_salario, nombre))
+        conexion.commit()
+        return cursor.rowcount > 0
+
+    def listar():
+        filas = conexion.execute("SELECT nombre, salario, departamento FROM empleados ORDER BY rowid")
+        return [{"nombre": nombre, "salario": salario, "departamento": departamento}
+                for nombre, salario, departamento in filas]
+
+    def promedio_departamento(departamento):
+        # AVG devuelve NULL (None) si no hay empleados en el departamento
+        fila = conexion.execute("SELECT AVG(salario) FROM empleados WHERE departamento = ?",
+                                (departamento,)).fetchone()
+        return fila[0]
+
+    almacen = {
+        "tipo": "sqlite",
+        "agregar": agregar,
+        "actualizar_salario": actualizar_salario,
+        "listar": listar,
+        "promedio_departamento": promedio_departamento
+    }
+
+    return almacen
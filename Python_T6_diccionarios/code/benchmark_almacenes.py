@@ -0,0 +1,73 @@
+""" Compara los almacenes de empleados reproduciendo la misma
+secuencia sintetica de operaciones sobre cada uno de ellos.
+
+Uso: python benchmark_almacenes.py [numero_operaciones]
+"""
+
+import random
+import sys
+import time
+
+import almacenes_empleados
+
+DEPARTAMENTOS = ["Ventas", "IT", "RRHH", "Finanzas", "Marketing", "Logistica"]
+
+
+def generar_traza(numero_operaciones, semilla = 0):
+    """ Genera una lista de operaciones aleatorias:
+    50% agregar, 30% actualizar salario, 20% promedio por departamento """
+    # INPUT:
+    # - numero_operaciones: int
+    # - semilla: int, para que la traza sea siempre la misma
+
+    aleatorio = random.Random(semilla)
+    traza = []
+    numero_empleados = 0
+
+    for i in range(numero_operaciones):
+        tirada = aleatorio.random()
+
+        if tirada < 0.5 or numero_empleados == 0:
+            salario = aleatorio.randint(15000, 90000)
+            traza.append(("agregar", f"empleado_{numero_empleados}", salario, aleatorio.choice(DEPARTAMENTOS)))
+            numero_empleados += 1
+        elif tirada < 0.8:
+            nombre = f"empleado_{aleatorio.randrange(numero_empleados)}"
+            traza.append(("actualizar_salario", nombre, aleatorio.randint(15000, 90000)))
+        else:
+            traza.append(("promedio_departamento", aleatorio.choice(DEPARTAMENTOS)))
+
+    return traza
+
+
+def reproducir_traza(almacen, traza):
+    """ Ejecuta la traza sobre el almacen y devuelve los segundos empleados """
+    # INPUT:
+    # - almacen: dict creado con almacenes_empleados
+    # - traza: lista creada con generar_traza
+
+    inicio = time.perf_counter()
+    for operacion in traza:
+        # el primer elemento es el nombre de la operacion, el resto sus argumentos
+        almacen[operacion[0]](*operacion[1:])
+    return time.perf_counter() - inicio
+
+
+# ---- programa principal ----
+if len(sys.argv) > 1:
+    numero_operaciones = int(sys.argv[1])
+else:
+    numero_operaciones = 10000
+
+traza = generar_traza(numero_operaciones)
+
+almacenes = [
+    almacenes_empleados.crear_almacen_lista(),
+    almacenes_empleados.crear_almacen_diccionario(),
+    almacenes_empleados.crear_almacen_sqlite()
+]
+
+print(f"Reproduciendo {numero_operaciones} operaciones")
+for almacen in almacenes:
+    segundos = reproducir_traza(almacen, traza)
+    print(f"Almacen: {almacen['tipo']:<12} Tiempo: {segundos:.3f} s  Operaciones/s: {numero_operaciones / segundos:,.0f}")
@@ -0,0 +1,82 @@
+# Clasificacion de jugadores que se actualiza con cada puntaje
+# Estructura de la clasificacion:
+# {
+#   "puntajes": {"jugador": puntaje, ...},
+#   "ordenados": [(-puntaje, "jugador"), ...]   <- lista ordenada, el mejor primero
+#   "suma": suma de todos los puntajes
+# }
+# Guardamos el puntaje en negativo para que la lista ordenada de menor
+# a mayor tenga primero los puntajes mas altos.
+
+import bisect
+
+
+def crear_clasificacion():
+    """ Crea una clasificacion vacia """
+
+    clasificacion = {
+        "puntajes": {},
+        "ordenados": [],
+        "suma": 0
+    }
+
+    return clasificacion
+
+
+def actualizar_puntaje(clasificacion, jugador, puntaje):
+    """ Registra el puntaje de un jugador (nuevo o existente) """
+    # INPUT:
+    # - clasificacion: dict creado con crear_clasificacion
+    # - jugador: str
+    # - puntaje: int
+
+    puntajes = clasificacion["puntajes"]
+    ordenados = clasificacion["ordenados"]
+
+    # si el jugador ya tenia puntaje lo quitamos de la lista y de la suma
+    if jugador in puntajes:
+        anterior = puntajes[jugador]
+        posicion_anterior = bisect.bisect_left(ordenados, (-anterior, jugador))
+        del ordenados[posicion_anterior]
+        clasificacion["suma"] -= anterior
+
+    puntajes[jugador] = puntaje
+    bisect.insort(ordenados, (-puntaje, jugador))
+    clasificacion["suma"] += puntaje
+
+
+def mejores(clasificacion, k = 1):
+    """ Devuelve los k mejores jugadores como lista de (jugador, puntaje) """
+    # INPUT:
+    # - clasificacion: dict creado con crear_clasificacion
+    # - k: int, numero de jugadores
+
+    return [(jugador, -puntaje_negativo) for puntaje_negativo, jugador in clasificacion["ordenados"][:k]]
+
+
+def posicion(clasificacion, jugador):
+    """ Devuelve la posicion del jugador en la clasificacion (1 es el primero)
+    buscandola por biseccion, o None si el jugador no existe """
+    # INPUT:
+    # - clasificacion: dict creado con crear_clasificacion
+    # - jugador: str
+
+    if jugador not in clasificacion["puntajes"]:
+        return None
+
+    puntaje = clasificacion["puntajes"][jugador]
+    return bisect.bisect_left(clasificacion["ordenados"], (-puntaje, jugador)) + 1
+
+
+def cantidad_jugadores(clasificacion):
+    """ Devuelve el numero de jugadores registrados """
+
+    return len(clasificacion["puntajes"])
+
+
+def promedio(clasificacion):
+    """ Devuelve el puntaje promedio, o None si no hay jugadores """
+
+    if cantidad_jugadores(clasificacion) == 0:
+        return None
+    return clasificacion["suma"] / cantidad_jugadores(clasificacion)
@@ -0,0 +1,158 @@
+# Diario de votos en disco (solo se añade al final)
+# Cada voto es un registro binario de 8 bytes:
+#   - 4 bytes: id del candidato (entero sin signo)
+#   - 4 bytes: suma de control del id
+# Los nombres de los candidatos se guardan en un fichero de texto aparte
+# (ruta + ".candidatos"), una linea por candidato: la linea n es el id n.
+# Estructura del diario abierto:
+# {
+#   "ruta": ruta del fichero de votos,
+#   "fichero": fichero binario abierto para añadir,
+#   "candidatos": ["nombre id 0", "nombre id 1", ...],
+#   "ids": {"nombre": id, ...},
+#   "pendientes": votos escritos desde el ultimo fsync,
+#   "tamano_lote": cada cuantos votos se hace fsync
+# }
+
+import os
+import struct
+
+import numpy as np
+
+FORMATO_REGISTRO = "<II"
+TAMANO_REGISTRO = struct.calcsize(FORMATO_REGISTRO)
+TIPO_REGISTRO = np.dtype([("candidato", "<u4"), ("control", "<u4")])
+
+
+def suma_control(ids):
+    """ Calcula la suma de control de uno o varios ids de candidato
+    (hash multiplicativo de 32 bits). Funciona con int y con arrays """
+
+    return (ids * 2654435761 + 0x9E3779B9) & 0xFFFFFFFF
+
+
+def _ruta_candidatos(ruta):
+    return ruta + ".candidatos"
+
+
+def _leer_candidatos(ruta):
+    """ Devuelve la lista de candidatos guardada junto al diario """
+
+    if not os.path.exists(_ruta_candidatos(ruta)):
+        return []
+
+    with open(_ruta_candidatos(ruta), encoding = "utf-8") as fichero:
+        return fichero.read().splitlines()
+
+
+def abrir_diario(ruta, tamano_lote = 1000):
+    """ Abre (o crea) el diario de votos para añadir votos al final """
+    # INPUT:
+    # - ruta: str, fichero de votos
+    # - tamano_lote: int, cada cuantos votos se fuerza la escritura a disco
+
+    candidatos = _leer_candidatos(ruta)
+
+    diario = {
+        "ruta": ruta,
+        "fichero": open(ruta, "ab"),
+        "candidatos": candidatos,
+        "ids": {nombre: i for i, nombre in enumerate(candidatos)},
+        "pendientes": 0,
+        "tamano_lote": tamano_lote
+    }
+
+    return diario
+
+
+def escribir_voto(diario, candidato):
+    """ Añade un voto al final del diario """
+    # INPUT:
+    # - diario: dict creado con abrir_diario
+    # - candidato: str
+
+    # si el candidato es nuevo le damos un id y lo guardamos en disco
+    # antes que cualquier voto que lo use
+    if candidato not in diario["ids"]:
+        diario["ids"][candidato] = len(diario["candidatos"])
+        diario["candidatos"].append(candidato)
+        with open(_ruta_candidatos(diario["ruta"]), "a", encoding = "utf-8") as fichero:
+            fichero.write(candidato + "\n")
+            fichero.flush()
+            os.fsync(fichero.fileno())
+
+    id_candidato = diario["ids"][candidato]
+    diario["fichero"].write(struct.pack(FORMATO_REGISTRO, id_candidato, suma_control(id_candidato)))
+
+    # en vez de hacer fsync con cada voto lo hacemos por lotes
+    diario["pendientes"] += 1
+    if diario["pendientes"] >= diario["tamano_lote"]:
+        sincronizar(diario)
+
+
+def sincronizar(diario):
+    """ Fuerza la escritura a disco de los votos pendientes """
+
+    diario["fichero"].flush()
+    os.fsync(diario["fichero"].fileno())
+    diario["pendientes"] = 0
+
+
+def cerrar_diario(diario):
+    """ Sincroniza y cierra el diario """
+
+    sincronizar(diario)
+    diario["fichero"].close()
+
+
+def recontar(ruta, tamano_bloque = 1000000):
+    """ Recuenta todos los votos del diario proyectando el fichero en
+    memoria y contando los ids con np.bincount, por bloques de
+    tamano_bloque registros para que la memoria no dependa del
+    tamaño del diario.
+    Devuelve (votos, registros_invalidos) donde votos es un dict
+    {"candidato": votos} """
+    # INPUT:
+    # - ruta: str, fichero de votos
+    # - tamano_bloque: int, registros que se procesan de una vez
+
+    # si todavia no hay diario no hay votos
+    if not os.path.exists(ruta):
+        return {}, 0
+
+    candidatos = _leer_candidatos(ruta)
+    # un registro incompleto al final (escritura cortada) no se cuenta
+    numero_registros = os.path.getsize(ruta) // TAMANO_REGISTRO
+
+    if numero_registros == 0:
+        return {}, 0
+
+    registros = np.memmap(ruta, dtype = TIPO_REGISTRO, mode = "r", shape = (numero_registros,))
+    conteo = np.zeros(len(candidatos), dtype = np.int64)
+    registros_invalidos = 0
+
+    # las copias (ids en uint64, sumas de control, mascaras) solo
+    # ocupan lo que ocupa un bloque
+    for inicio in range(0, numero_registros, tamano_bloque):
+        bloque = registros[inicio:inicio + tamano_bloque]
+        ids = bloque["candidato"].astype(np.uint64)
+
+        # descartamos los registros con la suma de control incorrecta
+        # o con un id que no esta en la lista de candidatos
+        validos = (suma_control(ids) == bloque["control"]) & (ids < len(candidatos))
+        conteo += np.bincount(ids[validos], minlength = len(candidatos))
+        registros_invalidos += int(len(bloque) - np.count_nonzero(validos))
+
+    votos = {candidatos[i]: int(conteo[i]) for i in range(len(candidatos)) if conteo[i] > 0}
+
+    return votos, registros_invalidos
+
+
+def verificar(ruta, votos_memoria):
+    """ Comprueba que el recuento del diario coincide con los votos
+    que hay en memoria (los registros dañados no se cuentan) """
+    # INPUT:
+    # - ruta: str, fichero de votos
+    # - votos_memoria: dict {"candidato": votos}
+
+    return recontar(ruta)[0] == votos_memoria
@@ -0,0 +1,105 @@
+# Indices secundarios para la base de datos de empleados
+# Estructura del indice:
+# {
+#   "departamentos": {"departamento": {"suma": suma salarios, "contador": n empleados}, ...},
+#   "salarios": [(salario, nombre), (salario, nombre), ...]   <- lista ordenada
+# }
+
+import bisect
+
+
+def crear_indice():
+    """ Crea un indice vacio por departamento y por salario """
+
+    indice = {
+        "departamentos": {},
+        "salarios": []
+    }
+
+    return indice
+
+
+def indexar_empleado(indice, nombre, salario, departamento):
+    """ Suma un empleado nuevo a los indices """
+    # INPUT:
+    # - indice: dict creado con crear_indice
+    # - nombre: str
+    # - salario: float
+    # - departamento: str
+
+    # si el departamento no existe lo creamos con la suma y el contador a 0
+    if departamento not in indice["departamentos"]:
+        indice["departamentos"][departamento] = {"suma": 0, "contador": 0}
+
+    # actualizamos los totales del departamento
+    indice["departamentos"][departamento]["suma"] += salario
+    indice["departamentos"][departamento]["contador"] += 1
+
+    # insertamos el salario manteniendo la lista ordenada
+    bisect.insort(indice["salarios"], (salario, nombre))
+
+
+def desindexar_empleado(indice, nombre, salario, departamento):
+    """ Quita un empleado de los indices """
+    # INPUT:
+    # - indice: dict creado con crear_indice
+    # - nombre: str
+    # - salario: float (el salario con el que se indexo)
+    # - departamento: str
+
+    totales = indice["departamentos"][departamento]
+    totales["suma"] -= salario
+    totales["contador"] -= 1
+
+    # si el departamento se queda vacio lo borramos
+    if totales["contador"] == 0:
+        del indice["departamentos"][departamento]
+
+    # buscamos la posicion exacta del par (salario, nombre) y la quitamos
+    posicion = bisect.bisect_left(indice["salarios"], (salario, nombre))
+    del indice["salarios"][posicion]
+
+
+def actualizar_salario_indice(indice, nombre, departamento, salario_anterior, salario_nuevo):
+    """ Actualiza los indices cuando cambia el salario de un empleado """
+    # INPUT:
+    # - indice: dict creado con crear_indice
+    # - nombre: str
+    # - departamento: str
+    # - salario_anterior: float
+    # - salario_nuevo: float
+
+    desindexar_empleado(indice, nombre, salario_anterior, departamento)
+    indexar_empleado(indice, nombre, salario_nuevo, departamento)
+
+
+def promedio_departamento(indice, departamento):
+    """ Devuelve el salario promedio del departamento sin recorrer
+    los empleados, o None si el departamento no tiene empleados """
+    # INPUT:
+    # - indice: dict creado con crear_indice
+    # - departamento: str
+
+    if departamento not in indice["departamentos"]:
+        return None
+
+    totales = indice["departamentos"][departamento]
+    return totales["suma"] / totales["contador"]
+
+
+def empleados_en_rango(indice, salario_minimo, salario_maximo):
+    """ Devuelve la lista de (salario, nombre) con el salario entre
+    salario_minimo y salario_maximo (ambos incluidos), ordenada por salario """
+    # INPUT:
+    # - indice: dict creado con crear_indice
+    # - salario_minimo: float
+    # - salario_maximo: float
+
+    salarios = indice["salarios"]
+
+    # buscamos por biseccion los extremos del rango
+    # ("" es el nombre mas pequeño posible y chr(0x10FFFF) el mas grande)
+    inicio = bisect.bisect_left(salarios, (salario_minimo, ""))
+    fin = bisect.bisect_right(salarios, (salario_maximo, chr(0x10FFFF)))
+
+    return salarios[inicio:fin]
@@ -0,0 +1,88 @@
+# Carga masiva de ventas desde un fichero o desde la entrada estandar
+# Formato del fichero: una venta por linea, "producto,cantidad"
+#   Camisa,3
+#   Pantalon,1
+# Las ventas se leen por lotes y cada lote se agrupa con un Counter antes
+# de sumarlo al registro de ventas.
+# Un fichero se carga entero o no se carga: si tiene una linea mal formada
+# no se suma ninguna de sus ventas al registro.
+
+import sys
+from collections import Counter
+
+
+def leer_lotes(fichero, tamano_lote = 10000):
+    """ Lee las ventas del fichero y las devuelve por lotes,
+    cada lote es una lista de (producto, cantidad) """
+    # INPUT:
+    # - fichero: fichero de texto abierto
+    # - tamano_lote: int, numero de lineas por lote
+
+    lote = []
+    for numero_linea, linea in enumerate(fichero, 1):
+        linea = linea.strip()
+        # ignoramos las lineas vacias
+        if not linea:
+            continue
+
+        # separamos por la ultima coma por si el producto lleva comas
+        try:
+            producto, cantidad = linea.rsplit(",", 1)
+            lote.append((producto.strip(), int(cantidad)))
+        except ValueError:
+            raise ValueError(f"Linea {numero_linea} mal formada: {linea!r}") from None
+
+        if len(lote) == tamano_lote:
+            yield lote
+            lote = []
+
+    # ultimo lote incompleto
+    if lote:
+        yield lote
+
+
+def ingerir_lote(ventas, lote):
+    """ Suma un lote de ventas al registro y devuelve
+    la cantidad total del lote """
+    # INPUT:
+    # - ventas: Counter {"producto": cantidad}
+    # - lote: lista de (producto, cantidad)
+
+    agrupado = Counter()
+    for producto, cantidad in lote:
+        agrupado[producto] += cantidad
+
+    ventas.update(agrupado)
+    return sum(agrupado.values())
+
+
+def ingerir_fichero(ventas, ruta, tamano_lote = 10000):
+    """ Carga todas las ventas de un fichero ("-" para la entrada estandar)
+    y devuelve (cantidad total cargada, numero de ventas leidas).
+    Si el fichero no se puede abrir (OSError) o tiene una linea mal
+    formada (ValueError) lanza la excepcion sin tocar ventas """
+    # INPUT:
+    # - ventas: Counter {"producto": cantidad}
+    # - ruta: str, ruta del fichero o "-"
+    # - tamano_lote: int, numero de lineas por lote
+
+    if ruta == "-":
+        fichero = sys.stdin
+    else:
+        fichero = open(ruta, encoding = "utf-8")
+
+    # acumulamos el fichero aparte y solo lo sumamos al registro al final,
+    # asi un error a mitad de fichero no deja el registro a medias
+    ventas_fichero = Counter()
+    cantidad_total = 0
+    numero_ventas = 0
+    try:
+        for lote in leer_lotes(fichero, tamano_lote):
+            cantidad_total += ingerir_lote(ventas_fichero, lote)
+            numero_ventas += len(lote)
+    finally:
+        if fichero is not sys.stdin:
+            fichero.close()
+
+    ventas.update(ventas_fichero)
+    return cantidad_total, numero_ventas
@@ -0,0 +1,27 @@
+""" Recuento completo de un diario de votos.
+
+Uso: python recontar_votos.py [fichero_votos]
+"""
+
+import sys
+import time
+
+import diario_votos
+
+# fichero de votos a recontar
+if len(sys.argv) > 1:
+    ruta = sys.argv[1]
+else:
+    ruta = "votos.log"
+
+inicio = time.perf_counter()
+votos, registros_invalidos = diario_votos.recontar(ruta)
+segundos = time.perf_counter() - inicio
+
+total_votos = sum(votos.values())
+print(f"Recuento de {ruta}: {total_votos} votos en {segundos:.3f} s")
+for candidato, cantidad in sorted(votos.items(), key = lambda par: par[1], reverse = True):
+    print(f"Candidato: {candidato}, Votos: {cantidad}")
+
+if registros_invalidos > 0:
+    print(f"Atencion: {registros_invalidos} registros con suma de control incorrecta")
@@ -0,0 +1,109 @@
+# Motor de recuento de votos
+# Estructura del recuento:
+# {
+#   "votos": {"candidato": votos, ...},
+#   "total": total de votos registrados,
+#   "orden": {"candidato": posicion en la que recibio su primer voto},
+#   "lider": candidato con mas votos (None si no hay votos); si hay empate,
+#            el que recibio su primer voto antes,
+#   "cerrojo": threading.Lock para que varios hilos puedan votar a la vez
+# }
+# El total y el lider se actualizan con cada voto, asi que consultarlos
+# no necesita recorrer todos los candidatos.
+
+import threading
+from collections import Counter
+
+
+def crear_recuento():
+    """ Crea un recuento de votos vacio """
+
+    recuento = {
+        "votos": {},
+        "orden": {},
+        "total": 0,
+        "lider": None,
+        "cerrojo": threading.Lock()
+    }
+
+    return recuento
+
+
+def _sumar_votos(recuento, candidato, cantidad):
+    """ Suma votos a un candidato y actualiza total y lider.
+    Se debe llamar con el cerrojo adquirido """
+
+    votos = recuento["votos"]
+    orden = recuento["orden"]
+    if candidato not in votos:
+        orden[candidato] = len(orden)
+    votos[candidato] = votos.get(candidato, 0) + cantidad
+    recuento["total"] += cantidad
+
+    # como los votos solo crecen, solo puede pasar a ser lider
+    # el candidato que acaba de recibir votos. Los empates se deciden por
+    # el orden del primer voto (igual que max sobre el diccionario), asi
+    # el ganador no depende del orden en que llegan los demas votos
+    lider = recuento["lider"]
+    if lider is None or votos[candidato] > votos[lider] or \
+            (votos[candidato] == votos[lider] and orden[candidato] < orden[lider]):
+        recuento["lider"] = candidato
+
+
+def registrar_voto(recuento, candidato):
+    """ Registra un voto. Se puede llamar desde varios hilos a la vez """
+    # INPUT:
+    # - recuento: dict creado con crear_recuento
+    # - candidato: str
+
+    with recuento["cerrojo"]:
+        _sumar_votos(recuento, candidato, 1)
+
+
+def registrar_votos(recuento, candidato, cantidad):
+    """ Registra varios votos para un mismo candidato """
+    # INPUT:
+    # - recuento: dict creado con crear_recuento
+    # - candidato: str
+    # - cantidad: int
+
+    with recuento["cerrojo"]:
+        _sumar_votos(recuento, candidato, cantidad)
+
+
+def registrar_lote(recuento, candidatos):
+    """ Registra de una vez un lote de votos. Los votos se agrupan
+    antes de adquirir el cerrojo, asi cada hilo lo bloquea solo una vez
+    por lote y no una vez por voto """
+    # INPUT:
+    # - recuento: dict creado con crear_recuento
+    # - candidatos: iterable de str, un elemento por voto
+
+    agrupados = Counter(candidatos)
+
+    with recuento["cerrojo"]:
+        for candidato, cantidad in agrupados.items():
+            _sumar_votos(recuento, candidato, cantidad)
+
+
+def total_votos(recuento):
+    """ Devuelve el total de votos registrados """
+
+    return recuento["total"]
+
+
+def ganador(recuento):
+    """ Devuelve el candidato con mas votos, o None si no hay votos """
+
+    return recuento["lider"]
+
+
+def porcentaje(recuento, candidato):
+    """ Devuelve el porcentaje de votos de un candidato """
+    # INPUT:
+    # - recuento: dict creado con crear_recuento
+    # - candidato: str
+
+    if recuento["total"] == 0:
+        return 0.0
+    return recuento["votos"].get(candidato, 0) / recuento["total"] * 100